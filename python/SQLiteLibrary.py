@@ -1,445 +1,1371 @@
-"""
-Copyright (c) 2020 Jason Reek
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-"""
-
-import sqlite3
-import os 
-from enum import Enum
-
-
-class SQLTypes(Enum):
-    """Enumerated SQL data types."""
-    NULL = 0
-    BOOL = 1
-    INTEGER = 2
-    TEXT = 3
-    REAL = 4
-    BLOB = 5
-
-class SQLiteLib:
-    """ 
-        An SQL wrapper library for abstracting away SQL complexity in exchange
-        for python methods. 
-    """
-    def __init__(self, database_location=None):
-        self._database_location = database_location
-        self._database = None 
-        self._connection = None 
-        self._cursor = None 
-        self._connected_to_database = False
-        self._current_row_id = None  
-
-    def createNewDatabase(self, database_name):
-        """Creates a new database."""
-        try:
-            connection = None
-            if ".db" not in database_name:
-                database_name = database_name+".db" 
-            database_location = "/".join(["database", database_name])
-            if os.path.isfile(database_location):
-                print("Database already exists!") 
-            else:
-                connection = sqlite3.connect(database_location)
-                print("Creating database... SQLite version", sqlite3.version)
-
-        except Exception as e:
-            print("Failed to create or read database:",e)
-        finally:
-            if connection:
-                connection.close()
-
-    def getSQLType(self, sql_type):
-        """Returns the SQL type if it exists."""
-        types = {
-            SQLTypes.NULL: "NULL",
-            SQLTypes.BOOL: "INTEGER",
-            SQLTypes.INTEGER: "INTEGER",
-            SQLTypes.TEXT: "TEXT",
-            SQLTypes.REAL: "REAL",
-            SQLTypes.BLOB: "BLOB"
-        }
-        if sql_type not in types:
-            return None
-        return types[sql_type]
-
-    def detectSQLType(self, value):
-        """SQL python type checking."""
-        if isinstance(value, int):
-            return self.getSQLType(SQLTypes.INTEGER)
-        if isinstance(value, float):
-            return self.getSQLType(SQLTypes.REAL)
-        if isinstance(value, str):
-            return self.getSQLType(SQLTypes.TEXT)
-        if isinstance(value, bool):
-            return self.getSQLType(SQLTypes.INTEGER)
-        if isinstance(value, bytes):
-            return self.getSQLType(SQLTypes.BLOB)
-        return self.getSQLType(SQLTypes.NULL)
-
-    # openDatabase()
-    #
-    # -Opens the database, if a different location is
-    #  placed in the parameter than the one used in 
-    #  object init, then the method will use the db location
-    #  placed in it's parameter. 
-    def openDatabase(self, database_location=None):
-        """
-        Opens the database; if a different location is placed in the parameter than the one used in 
-        object init, then the method will use the db location placed in its parameter.
-        """
-        try:
-            # Set new database
-            if self._database_location != database_location and database_location != None:
-                self._database_location = database_location
-            
-            if self._database_location != None and not self._connected_to_database:
-                self._connection = sqlite3.connect(self._database_location)
-                self._cursor = self._connection.cursor()
-                self._connected_to_database = True
-
-        except Exception as e:
-            print("Failed to open the database: ",e)
-    
-    # closeDatabase()
-    #
-    # -Closes the database connection. 
-    def closeDatabase(self):
-        """Closes the database connection."""
-        try:
-            if self._connection != None and self._connected_to_database:
-                self._connection.close()
-                self._connected_to_database = False 
-        except Exception as e:
-            print("Failed to close the database: "+str(e))
-
-    def fixInTextApostrophes(self, string):
-        """Handles when a string contains an apostrophe."""
-        if "'" in string:
-            new_string = ""
-            for i in range(0, len(string)):
-                if string[i] == "'":
-                    new_string = new_string + "\'"
-                else:
-                    new_string = new_string + string[i]
-            return new_string
-        return string 
-    
-    # createSQLInsertCommand()
-    #
-    # -This method is primarily for internal use.
-    #  It basically preps the requested fields into an SQL
-    #  command string, and also inserts with the "?"s in the
-    #  SQL VALUE() entry string. 
-    def createSQLInsertCommand(self, table_name="", fields=[]):
-        """
-        This method is primarily for internal use.
-        It basically preps the requested fields into an SQL
-        command string, and also inserts with the "?"s in the
-        SQL VALUE() entry string.
-        """
-        command_head = " ".join(["INSERT INTO", table_name, "("])
-        command_list = []
-        command_temp = ""
-        command = ""
-        value_list = []
-        value_temp = ""
-        value = ""
-        try:
-            if table_name != "" and len(fields) > 0:
-                command_list.append("ID")
-                for field in fields:
-                    command_list.append(field)
-                    value_list.append('?')
-                value_list.append('?')
-                value_temp = ", ".join(value_list)
-                value = "".join(["VALUES (", value_temp, ")"])
-                command_temp = ", ".join(command_list)
-                command = "".join([command_head, command_temp, ") ", value])
-         
-        except Exception as e:
-            print("Failed to create SQL command: "+command+" - "+str(e))
-            print("command_head:", command_head)
-            print("command_list", command_list)
-            print("command_temp", command_temp)
-            print("value_list", value_list)
-            print("value_temp", value_temp)
-            print("value", value)
-            return command
-        return command
-
-    # insertRow()
-    #
-    # -Inserts a record into the chosen table.
-    #  The length of the fields and values MUST 
-    #  match inorder to insert a record. 
-    def insertRow(self, table_name="", fields=[], values=[]):
-        """
-        Inserts a record into the chosen table.
-        The length of the fields and values MUST 
-        match inorder to insert a record.
-        """
-        sql_statement= ""
-        mod_vals = []
-        if len(values) > 0 and table_name != "":
-            mod_vals.append(self.getNextRowID(table_name))
-            mod_vals.extend(values)
-            for i, value in enumerate(values):
-                if isinstance(value, str):
-                    mod_vals[i+1] = self.fixInTextApostrophes(value)
-
-        try:
-            if self._connected_to_database and table_name != "" and len(fields) > 0 and len(fields)+1 == len(mod_vals):
-                sql_statement = self.createSQLInsertCommand(table_name, fields)
-                self._cursor.execute(sql_statement, tuple(mod_vals))
-                self._connection.commit()
-
-        except Exception as e:
-            print("Failed to enter row: "+str(e))
-            self.closeDatabase()
-
-    def updateValue(self, table_name="", field="", value=None):
-        """ Updates the selected value in the record."""
-        try:
-            if self._connected_to_database and table_name != "" and field != "" and value != None:
-                if isinstance(value, str):
-                    value = self.fixInTextApostrophes(value)
-                    value = "'"+value+"'"
-                update_query = "UPDATE {tn} SET {cn} = {v}".format(tn=table_name, cn=field, v=str(value))
-                self._cursor.execute(update_query)
-                self._connection.commit()
-
-        except Exception as e:
-            print("Failed to update sqlite table: "+str(e))
-            self.closeDatabase()
-    # removeRow()
-    #
-    # -Removes a record from the chosen table. 
-    '''
-    *NOTE: ADD A REMOVE ALL FROM ID METHOD
-    '''
-    def removeRow(self, table_name="", word=""):
-        """ Removes a record from the selected table."""
-        try:
-            if self._connected_to_database and table_name != "" and word != "":
-                command = "".join(["DELETE FROM ", table_name, " WHERE WORD = '", str(word),"'"])
-                self._cursor.execute(command)
-                self._connection.commit()
-           
-        except Exception as e:
-            print("Failed to remove row: "+str(e))
-            self.closeDatabase()
-
-    def readRow(self, table_name="", row_id=-1):
-        """Returns a selected row."""
-        try:
-            if self._connected_to_database and (table_name !="" and row_id != -1):
-                self._cursor.execute("SELECT * FROM {tn} WHERE {cn} = {ri}".format(tn=table_name, cn="ID", ri=str(row_id)))
-                row = self._cursor.fetchone()
-                return row
-
-        except Exception as e:
-            print("Failed to read row: "+str(e))
-            self.closeDatabase()
-    
-    def getValuesFromField(self, table_name, field):
-        """ Returns values from a selected field."""
-        try:
-            if self._connected_to_database and (table_name != "" and field != ""):
-                self._cursor.execute("SELECT {cn} FROM {tn}".format(tn=table_name, cn=field))
-                values = [value[0] for value in self._cursor.fetchall()]
-                return values
-
-        except Exception as e:
-            print("Failed to read row: "+str(e))
-            self.closeDatabase()
-    
-    def getCondValuesFromField(self, table_name, field, cond, cond_val):
-        """Returns values from a field with a specified condition value.""" 
-        try:
-            if self._connected_to_database and (table_name != "" and field != ""):
-                self._cursor.execute("SELECT {cn} FROM {tn} WHERE {cd} = '{cdv}' ".format(tn=table_name, cn=field, cd=cond, cdv=cond_val))
-                values = [value[0] for value in self._cursor.fetchall()]
-                return values
-
-        except Exception as e:
-            print("Failed to read row: "+str(e))
-            self.closeDatabase()
-    
-    def getValuesFrom2Fields(self, table_name, field_1, field_2):
-        """Returns values from two specified fields."""
-        try:
-            if self._connected_to_database and (table_name != "" and field_1 != "" and field_2 != ""):
-                self._cursor.execute("SELECT {cn1},{cn2} FROM {tn}".format(tn=table_name, cn1=field_1, cn2=field_2))
-                values = self._cursor.fetchall()
-                return values
-
-        except Exception as e:
-            print("Failed to read row: "+str(e))
-            self.closeDatabase()
-    
-    def readTable(self, table_name=""):
-        """Read the entire contents of a table."""
-        try:
-            table = []
-            if self._connected_to_database and table_name != "":
-                self._cursor.execute("SELECT * FROM {tn}".format(tn=table_name))
-                table = self._cursor.fetchall()
-                table = [row[1] for row in table]
-            
-        except Exception as e:
-            print("Failed to read table: "+str(e))
-            self.closeDatabase()
-            return table
-        return table
-
-    def createTable(self, table_name="", data={}):
-        """Create a new table into the database."""
-        item_count = len(data)
-        command = """CREATE TABLE """+table_name+"""(
-        ID INTEGER PRIMARY KEY,
-        """
-        temp_line = ""
-        try:
-            if self._connected_to_database and table_name != "" and len(data) > 0:
-                if table_name not in self.readListOfTables():
-                    for field, value_and_prop in data.items():
-                        field_caps = field.upper()
-                        temp_line = temp_line+str(field_caps)
-                        temp_line = temp_line+" "+self.detectSQLType(value_and_prop["value"])
-                        if value_and_prop["is_not_null"]:
-                            temp_line = temp_line+" NOT NULL"
-                        if value_and_prop["is_unique"]:
-                            temp_line = temp_line+" UNIQUE"
-                        item_count -= 1
-                        # Don't add comma if last item. 
-                        if item_count > 0:
-                            temp_line = temp_line+","
-                        command = command+"\n"+temp_line
-                        temp_line = ""
-                    command = command+");"
-                    self._cursor.execute(command)
-                    self._connection.commit()
-                    print("Table {tn} created successfully.".format(tn=table_name))
-                else:
-                    print("Table {tn} already exists.".format(tn=table_name))
-
-        except sqlite3.Error as e:
-            print("Failed to create table {tn}: {err}".format(tn=table_name, err=str(e)))
-            self.closeDatabase()      
-
-    def removeTable(self, table_name=""):
-        """Removes a table from the database."""
-        try:
-            if self._connected_to_database and table_name != "":
-                if table_name in self.readListOfTables():
-                    self._cursor.execute("DROP TABLE {tn}".format(tn=table_name))
-                    print("Table {tn} removed successfully.".format(tn=table_name))
-                else:
-                    print("Table {tn} does not exist.".format(tn=table_name))
-        except Exception as e:
-            print("Failed to remove table: "+str(e))
-            self.closeDatabase()
-
-    def readListOfTables(self):
-        """ Returns a list of tables from the selected database."""
-        table_names = []
-        if self._connected_to_database:
-            self._cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            table_names = [table[0] for table in self._cursor.fetchall()]
-        return table_names
-
-    # getNextRowID()
-    #
-    # -Returns the next row ID from the chosen table
-    #  to be inserted into. This row ID does not exist 
-    #  yet. 
-    def getNextRowID(self, table_name=""):
-        try:
-            """
-            Returns the next row ID from the chosen table
-            to be inserted into. This row ID does not exist 
-            yet.
-            """
-            next_row_id = None 
-            if table_name != "":
-                command = " ".join(["SELECT MAX(ID) FROM", table_name])
-                self._cursor.execute(command)
-                # First row of table, so there is no next row 
-                next_row_id = self._cursor.fetchone()[0] 
-                if next_row_id == None:
-                    return 1
-                
-        except Exception as e:
-            print("Failed to get the next row id: "+str(e))
-            return next_row_id 
-        return (next_row_id + 1)
-    
-    # getFirstRowID()
-    #
-    # -Returns the first row ID from the chosen table.
-    def getFirstRowID(self, table_name=""):
-        """Returns the first row ID from the chosen table."""
-        try:
-            first_row_id = None 
-            if table_name != "":
-                command = " ".join(["SELECT MIN(ID) FROM", table_name])
-                self._cursor.execute(command)
-                first_row_id = int(self._cursor.fetchone()[0])
-            return first_row_id
-                
-        except Exception as e:
-            print("Failded to get the first row id: "+str(e))
-        return first_row_id
-    
-    # getLastRowID()
-    #
-    # -Returns the last row ID from the chosen table.
-    def getLastRowID(self, table_name=""):
-        """Returns the last row ID from the chosen table."""
-        try:
-            last_row_id = None 
-            if table_name != "":
-                command = " ".join(["SELECT MAX(ID) FROM", table_name])
-                self._cursor.execute(command)
-                last_row_id = int(self._cursor.fetchone()[0]) 
-            return last_row_id
-                
-        except Exception as e:
-            print("Failed to get the last row id: "+str(e))
-        return last_row_id
-    # getLastInsertedRowID()
-    #
-    # -Returns the row ID that was last inserted into.
-    # This method will return None if table has not been
-    # used yet. 
-    def getLastInsertedRowID(self):
-        """
-        Returns the row ID that was last inserted into.
-        This method will return None if table has not been
-        used yet.
-        """
-        try:
-            return self._cursor.lastrowid
-        except Exception as e:
-            print("Failed to get last used row ID: "+str(e))
-
-
-    
+"""
+Copyright (c) 2020 Jason Reek
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import sqlite3
+import os 
+import re
+import sys
+import json
+import queue
+import threading
+from collections import deque
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import Enum
+from time import perf_counter, time
+from urllib.request import pathname2url
+
+# Upper bound of both the built statement cache and sqlite3's own compiled statement cache.
+STATEMENT_CACHE_SIZE = 64
+
+# Page cache of every connection in KiB (a negative cache_size pragma means KiB).
+CACHE_SIZE_KIB = 8192
+
+# Number of read-only connections handed out per database in WAL mode.
+READ_POOL_SIZE = 4
+
+# Rows fetched per fetchmany call by the streaming iterators.
+FETCH_BATCH_SIZE = 256
+
+# Timings kept per statement shape for the percentiles.
+TIMING_SAMPLES = 512
+
+# Statements taking longer than this (in seconds) are reported as slow queries.
+SLOW_QUERY_SECONDS = 0.05
+
+# Literal strings and numbers, replaced by "?" in the statement shapes.
+SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+def statementShape(sql_statement):
+    """Returns the statement with its literals replaced by "?" and its whitespace collapsed."""
+    return " ".join(SQL_LITERALS.sub("?", sql_statement).split())
+
+def percentile(sorted_values, fraction):
+    """Returns the nearest-rank percentile (fraction between 0 and 1) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+def callerOf(frame):
+    """Returns "file:line function" of the first frame outside this library (the code that ran the query)."""
+    while frame is not None and frame.f_code.co_filename in (__file__, contextmanager.__code__.co_filename):
+        frame = frame.f_back
+    if frame is None:
+        return None
+    return "{fl}:{ln} {fn}".format(fl=os.path.basename(frame.f_code.co_filename), ln=frame.f_lineno, fn=frame.f_code.co_name)
+
+def configureWAL(connection):
+    """
+    Switches the connection's database to WAL journaling with tuned pragmas.
+    Returns false if the database can not use WAL (e.g. in-memory databases).
+    """
+    journal_mode = connection.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    if journal_mode.lower() != "wal":
+        return False
+    # In WAL mode NORMAL is still safe against corruption and skips most fsyncs.
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA cache_size = -{kib}".format(kib=CACHE_SIZE_KIB))
+    return True
+
+
+class SQLTypes(Enum):
+    """Enumerated SQL data types."""
+    NULL = 0
+    BOOL = 1
+    INTEGER = 2
+    TEXT = 3
+    REAL = 4
+    BLOB = 5
+
+class ReadConnectionPool:
+    """
+        A small pool of read-only connections to one database. In WAL mode these
+        readers never block, and are never blocked by, the single writer connection.
+    """
+    def __init__(self, database_location, size=READ_POOL_SIZE):
+        self._database_location = database_location
+        self._size = size
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._acquired = 0
+        self._waits = 0
+        self._closed = False
+
+    def _connect(self):
+        uri = "file:{path}?mode=ro".format(path=pathname2url(os.path.abspath(self._database_location)))
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        connection.execute("PRAGMA query_only = ON")
+        connection.execute("PRAGMA cache_size = -{kib}".format(kib=CACHE_SIZE_KIB))
+        return connection
+
+    def acquire(self, timeout=None):
+        """Hands out an idle read connection, opening one while below the pool size, else waits."""
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("The read pool of {db} is closed.".format(db=self._database_location))
+            self._acquired += 1
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            if self._created < self._size:
+                self._created += 1
+                create = True
+            else:
+                self._waits += 1
+                create = False
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._idle.get(timeout=timeout)
+
+    def release(self, connection):
+        """Gives a read connection back to the pool."""
+        if connection.in_transaction:
+            connection.rollback()
+        with self._lock:
+            if not self._closed:
+                self._idle.put(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Closes the idle connections, the busy ones are closed when released."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self):
+        with self._lock:
+            return {"size": self._size, "open": self._created, "acquired": self._acquired, "waits": self._waits}
+
+class ConnectionManager:
+    """
+        Keeps one long-lived connection per database location, so opening a
+        database reuses the existing connection instead of reconnecting.
+        Databases opened in WAL mode also get a pool of read-only connections.
+    """
+    def __init__(self):
+        self._connections = {}
+        self._read_pools = {}
+        self._wal_locations = set()
+        self._lock = threading.Lock()
+        self._connects = 0
+        self._reuses = 0
+        self._invalidations = 0
+        # Churn: rows changed per location since its last maintenance, kept across reconnects.
+        self._retired_changes = {}
+        self._change_baselines = {}
+
+    def connection(self, database_location, wal=False):
+        """Returns the connection for the database location, connecting only the first time."""
+        with self._lock:
+            connection = self._connections.get(database_location)
+            if connection is not None:
+                self._reuses += 1
+            else:
+                connection = sqlite3.connect(database_location, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+                self._connections[database_location] = connection
+                self._connects += 1
+            if wal and database_location not in self._wal_locations:
+                if configureWAL(connection):
+                    self._wal_locations.add(database_location)
+            return connection
+
+    def register(self, database_location, connection):
+        """Hands an already open connection (e.g. an in-memory copy) to the manager under a location name."""
+        with self._lock:
+            self._connections[database_location] = connection
+
+    def isWAL(self, database_location):
+        """Returns true if the database location was opened in WAL mode."""
+        with self._lock:
+            return database_location in self._wal_locations
+
+    def readPool(self, database_location):
+        """Returns the read-only connection pool of a database opened in WAL mode."""
+        with self._lock:
+            if database_location not in self._wal_locations:
+                raise sqlite3.ProgrammingError("{db} is not open in WAL mode.".format(db=database_location))
+            pool = self._read_pools.get(database_location)
+            if pool is None:
+                pool = self._read_pools[database_location] = ReadConnectionPool(database_location)
+            return pool
+
+    def isConnected(self, database_location):
+        """Returns true if a live connection exists for the database location."""
+        with self._lock:
+            return database_location in self._connections
+
+    def invalidate(self, database_location=None):
+        """Closes and forgets the connection of a database location (all of them if None)."""
+        with self._lock:
+            if database_location is None:
+                locations = list(self._connections.keys())
+            else:
+                locations = [database_location]
+            for location in locations:
+                pool = self._read_pools.pop(location, None)
+                if pool is not None:
+                    pool.close()
+                self._wal_locations.discard(location)
+                connection = self._connections.pop(location, None)
+                if connection is not None:
+                    try:
+                        self._retired_changes[location] = self._changes(location, connection)
+                        self._change_baselines.pop(location, None)
+                        connection.close()
+                    except Exception as e:
+                        print("Failed to close the database connection:", e)
+                    self._invalidations += 1
+
+    def _changes(self, database_location, connection):
+        changes = self._retired_changes.get(database_location, 0)
+        if connection is not None:
+            changes += connection.total_changes - self._change_baselines.get(database_location, 0)
+        return changes
+
+    def churn(self, database_location):
+        """Returns the number of rows inserted, updated or deleted in a database since its last maintenance."""
+        with self._lock:
+            return self._changes(database_location, self._connections.get(database_location))
+
+    def resetChurn(self, database_location):
+        """Starts counting the churn of a database from zero (after maintenance)."""
+        with self._lock:
+            self._retired_changes.pop(database_location, None)
+            connection = self._connections.get(database_location)
+            if connection is not None:
+                self._change_baselines[database_location] = connection.total_changes
+
+    def stats(self):
+        """Returns the connection counts and the reuse hit rate."""
+        with self._lock:
+            requests = self._connects + self._reuses
+            return {
+                "open_connections": len(self._connections),
+                "connects": self._connects,
+                "reuses": self._reuses,
+                "invalidations": self._invalidations,
+                "hit_rate": (self._reuses / requests) if requests else 0.0,
+                "read_pools": {location: pool.stats() for location, pool in self._read_pools.items()}
+            }
+
+# Shared by every SQLiteLib instance unless one is given its own manager.
+CONNECTIONS = ConnectionManager()
+
+class StatementStats:
+    """
+        Execution counts, timings (with percentiles), returned rows and callers of every
+        statement, keyed by the statement shape. Statements slower than the slow query
+        threshold are handed to the slow query listeners, and every statement can be
+        written to a JSON-lines trace file for offline profiling.
+    """
+    def __init__(self, slow_query_seconds=SLOW_QUERY_SECONDS):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._slow_query_seconds = slow_query_seconds
+        self._slow_query_listeners = []
+        self._trace_file = None
+
+    def setSlowQueryThreshold(self, seconds):
+        """Sets the time (in seconds) above which a statement is reported as a slow query."""
+        self._slow_query_seconds = seconds
+
+    def slowQueryThreshold(self):
+        return self._slow_query_seconds
+
+    def addSlowQueryListener(self, listener):
+        """listener(entry) is called, on the thread that ran it, for every slow statement."""
+        self._slow_query_listeners.append(listener)
+
+    def removeSlowQueryListener(self, listener):
+        if listener in self._slow_query_listeners:
+            self._slow_query_listeners.remove(listener)
+
+    def startTrace(self, trace_location):
+        """Appends a JSON line per executed statement to the trace file (until stopTrace)."""
+        self.stopTrace()
+        trace_file = open(trace_location, "a", encoding="utf-8")
+        with self._lock:
+            self._trace_file = trace_file
+
+    def stopTrace(self):
+        with self._lock:
+            trace_file, self._trace_file = self._trace_file, None
+        if trace_file is not None:
+            trace_file.close()
+
+    def record(self, sql_statement, seconds, rows=None, caller=None):
+        """Records one execution of a statement, rows is the number of rows returned or changed."""
+        shape = statementShape(sql_statement)
+        with self._lock:
+            stat = self._stats.get(shape)
+            if stat is None:
+                stat = self._stats[shape] = {"count": 0, "total_time": 0.0, "max_time": 0.0, "rows": 0,
+                                             "samples": deque(maxlen=TIMING_SAMPLES), "callers": {}}
+            stat["count"] += 1
+            stat["total_time"] += seconds
+            stat["max_time"] = max(stat["max_time"], seconds)
+            stat["rows"] += rows or 0
+            stat["samples"].append(seconds)
+            stat["callers"][caller] = stat["callers"].get(caller, 0) + 1
+            trace_file = self._trace_file
+            slow = self._slow_query_seconds is not None and seconds >= self._slow_query_seconds
+            if trace_file is None and not slow:
+                return
+            entry = {"time": time(), "statement": shape, "seconds": seconds, "rows": rows,
+                     "caller": caller, "thread": threading.current_thread().name}
+            if trace_file is not None:
+                try:
+                    trace_file.write(json.dumps(entry)+"\n")
+                except Exception as e:
+                    print("Failed to write the query trace: "+str(e))
+        if slow:
+            for listener in list(self._slow_query_listeners):
+                listener(entry)
+
+    def stats(self):
+        """Returns per statement shape its count, times, p50/p90/p99 times, rows and callers."""
+        with self._lock:
+            stats = {}
+            for shape, stat in self._stats.items():
+                samples = sorted(stat["samples"])
+                stats[shape] = {"count": stat["count"], "total_time": stat["total_time"], "max_time": stat["max_time"],
+                                "mean_time": stat["total_time"] / stat["count"], "rows": stat["rows"],
+                                "p50": percentile(samples, 0.5), "p90": percentile(samples, 0.9), "p99": percentile(samples, 0.99),
+                                "callers": dict(stat["callers"])}
+            return stats
+
+    def percentiles(self, fractions=(0.5, 0.9, 0.99)):
+        """Returns the percentiles of the recent timings of every statement taken together."""
+        with self._lock:
+            samples = sorted(seconds for stat in self._stats.values() for seconds in stat["samples"])
+        return {fraction: percentile(samples, fraction) for fraction in fractions}
+
+    def slowest(self, count=10, key="p90"):
+        """Returns the (shape, stats) pairs of the count slowest statements by key."""
+        return sorted(self.stats().items(), key=lambda item: item[1][key], reverse=True)[:count]
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+# Shared by every SQLiteLib instance unless one is given its own statistics.
+STATEMENTS = StatementStats()
+
+class QueryBuilder:
+    """
+        Builds parameterized SQL statements. Table and column names must belong to
+        the whitelisted vocabulary (the tables and columns that really exist in the
+        database), values are always bound as "?" parameters. Built statements are kept
+        in a bounded cache so a statement shape always produces the same SQL text,
+        which lets sqlite3 reuse the compiled statement.
+    """
+    IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+    AGGREGATES = ("MIN", "MAX", "COUNT")
+
+    def __init__(self, columns_loader, max_statements=STATEMENT_CACHE_SIZE):
+        # columns_loader(table_name) returns the table's column names or None if there is no such table.
+        self._columns_loader = columns_loader
+        self._vocabulary = {}
+        self._statements = OrderedDict()
+        self._max_statements = max_statements
+        self._hits = 0
+        self._misses = 0
+
+    def isIdentifier(self, name):
+        """Returns true if the name can be used as a table or column name."""
+        return isinstance(name, str) and bool(self.IDENTIFIER.match(name))
+
+    def forget(self, table_name=None):
+        """Forgets the vocabulary (and statements) of a table, or of every table if None."""
+        if table_name is None:
+            self._vocabulary.clear()
+            self._statements.clear()
+        else:
+            self._vocabulary.pop(table_name, None)
+            for key in [key for key in self._statements if key[1] == table_name]:
+                del self._statements[key]
+
+    def columns(self, table_name):
+        """Returns the whitelisted columns of a table, raises ValueError for unknown tables."""
+        columns = self._vocabulary.get(table_name)
+        if columns is None:
+            if not self.isIdentifier(table_name):
+                raise ValueError("Invalid table name: {tn}".format(tn=table_name))
+            columns = self._columns_loader(table_name)
+            if not columns:
+                raise ValueError("Unknown table: {tn}".format(tn=table_name))
+            # Every table can be addressed through its implicit rowid.
+            columns = self._vocabulary[table_name] = frozenset(columns) | {"rowid"}
+        return columns
+
+    def checkColumns(self, table_name, fields):
+        columns = self.columns(table_name)
+        for field in fields:
+            if field not in columns:
+                raise ValueError("Unknown column {cn} in table {tn}".format(cn=field, tn=table_name))
+
+    def _statement(self, key, build):
+        sql_statement = self._statements.get(key)
+        if sql_statement is not None:
+            self._statements.move_to_end(key)
+            self._hits += 1
+            return sql_statement
+        self._misses += 1
+        sql_statement = build()
+        self._statements[key] = sql_statement
+        if len(self._statements) > self._max_statements:
+            self._statements.popitem(last=False)
+        return sql_statement
+
+    def select(self, table_name, fields=("*",), cond=None, order_by=None):
+        """SELECT fields FROM table [WHERE cond = ?] [ORDER BY order_by]"""
+        fields = tuple(fields)
+        def build():
+            if fields != ("*",):
+                self.checkColumns(table_name, fields)
+            else:
+                self.columns(table_name)
+            statement = "SELECT {cn} FROM {tn}".format(cn=", ".join(fields), tn=table_name)
+            if cond is not None:
+                self.checkColumns(table_name, (cond,))
+                statement = statement+" WHERE {cd} = ?".format(cd=cond)
+            if order_by is not None:
+                self.checkColumns(table_name, (order_by,))
+                statement = statement+" ORDER BY {ob}".format(ob=order_by)
+            return statement
+        return self._statement(("select", table_name, fields, cond, order_by), build)
+
+    def aggregate(self, function, table_name, field):
+        """SELECT function(field) FROM table"""
+        def build():
+            if function not in self.AGGREGATES:
+                raise ValueError("Unsupported aggregate: {fn}".format(fn=function))
+            if function == "COUNT" and field == "*":
+                self.columns(table_name)
+            else:
+                self.checkColumns(table_name, (field,))
+            return "SELECT {fn}({cn}) FROM {tn}".format(fn=function, cn=field, tn=table_name)
+        return self._statement(("aggregate", table_name, function, field), build)
+
+    def insert(self, table_name, fields):
+        """INSERT INTO table (fields) VALUES (?, ...)"""
+        fields = tuple(fields)
+        def build():
+            self.checkColumns(table_name, fields)
+            return "INSERT INTO {tn} ({cn}) VALUES ({vl})".format(tn=table_name, cn=", ".join(fields), vl=", ".join("?" * len(fields)))
+        return self._statement(("insert", table_name, fields), build)
+
+    def update(self, table_name, field, cond=None):
+        """UPDATE table SET field = ? [WHERE cond = ?]"""
+        def build():
+            self.checkColumns(table_name, (field,) if cond is None else (field, cond))
+            statement = "UPDATE {tn} SET {cn} = ?".format(tn=table_name, cn=field)
+            if cond is not None:
+                statement = statement+" WHERE {cd} = ?".format(cd=cond)
+            return statement
+        return self._statement(("update", table_name, field, cond), build)
+
+    def delete(self, table_name, cond=None):
+        """DELETE FROM table [WHERE cond = ?]"""
+        def build():
+            if cond is None:
+                self.columns(table_name)
+                return "DELETE FROM {tn}".format(tn=table_name)
+            self.checkColumns(table_name, (cond,))
+            return "DELETE FROM {tn} WHERE {cd} = ?".format(tn=table_name, cd=cond)
+        return self._statement(("delete", table_name, cond), build)
+
+    def copy(self, target_table, target_fields, source_table, source_fields):
+        """INSERT INTO target (target_fields) SELECT source_fields FROM source"""
+        target_fields = tuple(target_fields)
+        source_fields = tuple(source_fields)
+        def build():
+            self.checkColumns(target_table, target_fields)
+            self.checkColumns(source_table, source_fields)
+            return "INSERT INTO {tt} ({tf}) SELECT {sf} FROM {st}".format(tt=target_table, tf=", ".join(target_fields), sf=", ".join(source_fields), st=source_table)
+        return self._statement(("copy", target_table, target_fields, source_table, source_fields), build)
+
+    def match(self, table_name, fields):
+        """
+        Ranked full-text (FTS5) query returning the fields and a snippet of the best
+        matching column, bound parameters are the MATCH query and the row limit.
+        """
+        fields = tuple(fields)
+        def build():
+            self.checkColumns(table_name, fields)
+            return ("SELECT {cn}, snippet({tn}, -1, char(1), char(2), '...', 12) FROM {tn} "
+                    "WHERE {tn} MATCH ? ORDER BY rank LIMIT ?").format(cn=", ".join(fields), tn=table_name)
+        return self._statement(("match", table_name, fields), build)
+
+    def union(self, schema_names, table_name, fields, cond=None, order_by=None):
+        """
+        SELECT fields, ? AS SOURCE FROM schema.table [WHERE cond = ?] UNION ALL ... [ORDER BY order_by]
+        over the same table of several (attached) schemas. The bound parameters are, for
+        every schema, its source label followed by the condition value (if cond is given).
+        """
+        schema_names = tuple(schema_names)
+        fields = tuple(fields)
+        def build():
+            if not schema_names or not all(self.isIdentifier(schema_name) for schema_name in schema_names):
+                raise ValueError("Invalid schema names: {sn}".format(sn=schema_names))
+            # The attached tables share the schema of the main one.
+            self.checkColumns(table_name, fields if cond is None else fields+(cond,))
+            selects = []
+            for schema_name in schema_names:
+                select = "SELECT {cn}, ? AS SOURCE FROM {sn}.{tn}".format(cn=", ".join(fields), sn=schema_name, tn=table_name)
+                if cond is not None:
+                    select = select+" WHERE {cd} = ?".format(cd=cond)
+                selects.append(select)
+            statement = " UNION ALL ".join(selects)
+            if order_by is not None:
+                if order_by not in fields:
+                    raise ValueError("The union can only be ordered by one of its fields: {ob}".format(ob=order_by))
+                statement = statement+" ORDER BY {ob}".format(ob=order_by)
+            return statement
+        return self._statement(("union", table_name, schema_names, fields, cond, order_by), build)
+
+    def stats(self):
+        """Returns the built statement cache size and hit counts."""
+        lookups = self._hits + self._misses
+        return {
+            "cached_statements": len(self._statements),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / lookups) if lookups else 0.0
+        }
+
+class SQLiteLib:
+    """ 
+        An SQL wrapper library for abstracting away SQL complexity in exchange
+        for python methods. 
+    """
+    def __init__(self, database_location=None, connection_manager=None, use_wal=False, statement_stats=None):
+        self._database_location = database_location
+        self._database = None 
+        self._connection = None 
+        self._cursor = None 
+        self._connected_to_database = False
+        self._current_row_id = None  
+        self._connections = connection_manager if connection_manager is not None else CONNECTIONS
+        self._use_wal = use_wal
+        self._queries = QueryBuilder(self.readTableColumns)
+        self._statement_stats = statement_stats if statement_stats is not None else STATEMENTS
+        # Read-only SQLiteLibs bound to the pooled read connections (WAL mode only).
+        self._readers = {}
+        self._readers_lock = threading.Lock()
+
+    def createNewDatabase(self, database_name):
+        """Creates a new database."""
+        try:
+            connection = None
+            if ".db" not in database_name:
+                database_name = database_name+".db" 
+            database_location = "/".join(["database", database_name])
+            if os.path.isfile(database_location):
+                print("Database already exists!") 
+            else:
+                connection = sqlite3.connect(database_location)
+                print("Creating database... SQLite version", sqlite3.version)
+
+        except Exception as e:
+            print("Failed to create or read database:",e)
+        finally:
+            if connection:
+                connection.close()
+
+    def getSQLType(self, sql_type):
+        """Returns the SQL type if it exists."""
+        types = {
+            SQLTypes.NULL: "NULL",
+            SQLTypes.BOOL: "INTEGER",
+            SQLTypes.INTEGER: "INTEGER",
+            SQLTypes.TEXT: "TEXT",
+            SQLTypes.REAL: "REAL",
+            SQLTypes.BLOB: "BLOB"
+        }
+        if sql_type not in types:
+            return None
+        return types[sql_type]
+
+    def detectSQLType(self, value):
+        """SQL python type checking."""
+        if isinstance(value, int):
+            return self.getSQLType(SQLTypes.INTEGER)
+        if isinstance(value, float):
+            return self.getSQLType(SQLTypes.REAL)
+        if isinstance(value, str):
+            return self.getSQLType(SQLTypes.TEXT)
+        if isinstance(value, bool):
+            return self.getSQLType(SQLTypes.INTEGER)
+        if isinstance(value, bytes):
+            return self.getSQLType(SQLTypes.BLOB)
+        return self.getSQLType(SQLTypes.NULL)
+
+    # openDatabase()
+    #
+    # -Opens the database, if a different location is
+    #  placed in the parameter than the one used in 
+    #  object init, then the method will use the db location
+    #  placed in it's parameter. The connection itself is
+    #  borrowed from the connection manager and reused.
+    def openDatabase(self, database_location=None):
+        """
+        Opens the database; if a different location is placed in the parameter than the one used in 
+        object init, then the method will use the db location placed in its parameter.
+        The underlying connection is kept alive by the connection manager and reused.
+        """
+        try:
+            # Set new database
+            if self._database_location != database_location and database_location != None:
+                if self._connected_to_database:
+                    self.closeDatabase()
+                self._database_location = database_location
+                self._queries.forget()
+            
+            if self._database_location != None and not self._connected_to_database:
+                self._connection = self._connections.connection(self._database_location, self._use_wal)
+                self._cursor = self._connection.cursor()
+                self._connected_to_database = True
+
+        except Exception as e:
+            print("Failed to open the database: ",e)
+    
+    # closeDatabase()
+    #
+    # -Releases the database connection. The connection
+    #  stays open in the connection manager until it is
+    #  invalidated. 
+    def closeDatabase(self):
+        """Releases the database connection back to the connection manager."""
+        try:
+            if self._connection != None and self._connected_to_database:
+                if self._connection.in_transaction:
+                    self._connection.rollback()
+                self._cursor.close()
+                self._connected_to_database = False 
+        except Exception as e:
+            print("Failed to close the database: "+str(e))
+            self.invalidateDatabase()
+
+    def invalidateDatabase(self, database_location=None):
+        """Really closes the connection of the database location (defaults to the current one)."""
+        if database_location is None:
+            database_location = self._database_location
+        if database_location == self._database_location:
+            self._connected_to_database = False
+            self._connection = None
+            self._cursor = None
+        with self._readers_lock:
+            self._readers.clear()
+        if database_location is not None:
+            self._connections.invalidate(database_location)
+
+    def _readerFor(self, connection):
+        """Returns the read-only SQLiteLib bound to a pooled read connection."""
+        with self._readers_lock:
+            reader = self._readers.get(connection)
+            if reader is None:
+                reader = SQLiteLib(self._database_location, self._connections)
+                reader._connection = connection
+                reader._statement_stats = self._statement_stats
+                self._readers[connection] = reader
+        reader._cursor = connection.cursor()
+        reader._connected_to_database = True
+        return reader
+
+    @contextmanager
+    def reading(self):
+        """
+        Yields an SQLiteLib for reading only. In WAL mode it is bound to one of the
+        pooled read-only connections, so reads run alongside the writer connection
+        (and other readers) without waiting for it. Otherwise this instance is yielded.
+        """
+        if not self._connections.isWAL(self._database_location):
+            yield self
+            return
+        pool = self._connections.readPool(self._database_location)
+        connection = pool.acquire()
+        reader = self._readerFor(connection)
+        try:
+            yield reader
+        finally:
+            reader.closeDatabase()
+            pool.release(connection)
+
+    def connectionStats(self):
+        """Returns the connection counts and reuse hit rate of the connection manager."""
+        return self._connections.stats()
+
+    def queryCacheStats(self):
+        """Returns the size and hit rate of the built statement cache."""
+        return self._queries.stats()
+
+    def _record(self, sql_statement, seconds, rows):
+        self._statement_stats.record(sql_statement, seconds, rows, callerOf(sys._getframe(2)))
+
+    def execute(self, sql_statement, parameters=(), cursor=None):
+        """
+        Executes one statement with bound parameters (on cursor, if given), recording its
+        time and changed rows. Use query() for statements that return rows.
+        """
+        if cursor is None:
+            cursor = self._cursor
+        start = perf_counter()
+        rows = None
+        try:
+            cursor = cursor.execute(sql_statement, parameters)
+            rows = cursor.rowcount if cursor.rowcount >= 0 else None
+            return cursor
+        finally:
+            self._record(sql_statement, perf_counter() - start, rows)
+
+    def query(self, sql_statement, parameters=(), cursor=None):
+        """Executes one statement and returns all of its rows, recording its time (fetching included) and row count."""
+        if cursor is None:
+            cursor = self._cursor
+        start = perf_counter()
+        rows = []
+        try:
+            rows = cursor.execute(sql_statement, parameters).fetchall()
+            return rows
+        finally:
+            self._record(sql_statement, perf_counter() - start, len(rows))
+
+    def executeMany(self, sql_statement, parameter_rows):
+        """Executes one statement for every parameter row, recording its time and changed rows."""
+        start = perf_counter()
+        rows = None
+        try:
+            cursor = self._cursor.executemany(sql_statement, parameter_rows)
+            rows = cursor.rowcount if cursor.rowcount >= 0 else None
+            return cursor
+        finally:
+            self._record(sql_statement, perf_counter() - start, rows)
+
+    def readTableColumns(self, table_name):
+        """Returns the column names of a table, or None if the table does not exist."""
+        if not self._connected_to_database or table_name not in self.readListOfTables():
+            return None
+        return [column[1] for column in self.query('PRAGMA table_info("{tn}")'.format(tn=table_name.replace('"', '""')))]
+
+    def fixInTextApostrophes(self, string):
+        """Handles when a string contains an apostrophe."""
+        if "'" in string:
+            new_string = ""
+            for i in range(0, len(string)):
+                if string[i] == "'":
+                    new_string = new_string + "\'"
+                else:
+                    new_string = new_string + string[i]
+            return new_string
+        return string 
+    
+    # createSQLInsertCommand()
+    #
+    # -This method is primarily for internal use.
+    #  It basically preps the requested fields into an SQL
+    #  command string, and also inserts with the "?"s in the
+    #  SQL VALUE() entry string. Without include_id the ID
+    #  column is left out so SQLite assigns the row ID. 
+    def createSQLInsertCommand(self, table_name="", fields=[], include_id=True):
+        """
+        This method is primarily for internal use.
+        It basically preps the requested fields into an SQL
+        command string, and also inserts with the "?"s in the
+        SQL VALUE() entry string. Without include_id the ID
+        column is left out so SQLite assigns the row ID.
+        """
+        command_head = " ".join(["INSERT INTO", table_name, "("])
+        command_list = []
+        command_temp = ""
+        command = ""
+        value_list = []
+        value_temp = ""
+        value = ""
+        try:
+            if table_name != "" and len(fields) > 0:
+                if include_id:
+                    command_list.append("ID")
+                    value_list.append('?')
+                for field in fields:
+                    command_list.append(field)
+                    value_list.append('?')
+                value_temp = ", ".join(value_list)
+                value = "".join(["VALUES (", value_temp, ")"])
+                command_temp = ", ".join(command_list)
+                command = "".join([command_head, command_temp, ") ", value])
+         
+        except Exception as e:
+            print("Failed to create SQL command: "+command+" - "+str(e))
+            print("command_head:", command_head)
+            print("command_list", command_list)
+            print("command_temp", command_temp)
+            print("value_list", value_list)
+            print("value_temp", value_temp)
+            print("value", value)
+            return command
+        return command
+
+    # insertRows()
+    #
+    # -Inserts every record of an iterable of value
+    #  sequences with one executemany inside a single
+    #  transaction. Rows are streamed, so a generator
+    #  works as well as a list. Each row MUST have as
+    #  many values as there are fields.
+    def insertRows(self, table_name="", fields=[], rows=[]):
+        """
+        Inserts every record of an iterable of value sequences with one executemany
+        inside a single transaction, letting SQLite assign the row IDs. Rows are
+        streamed from the iterable. Returns the number of inserted records.
+        """
+        field_count = len(fields)
+
+        def checkedRows():
+            for values in rows:
+                values = tuple(values)
+                if len(values) != field_count:
+                    raise ValueError("Expected {fc} values but got {vc}.".format(fc=field_count, vc=len(values)))
+                yield values
+
+        try:
+            if self._connected_to_database and table_name != "" and field_count > 0:
+                sql_statement = self._queries.insert(table_name, fields)
+                with self._connection:
+                    self.executeMany(sql_statement, checkedRows())
+                return self._cursor.rowcount
+
+        except Exception as e:
+            print("Failed to enter rows: "+str(e))
+            self.closeDatabase()
+        return 0
+
+    # insertRow()
+    #
+    # -Inserts a record into the chosen table.
+    #  The length of the fields and values MUST 
+    #  match inorder to insert a record. 
+    def insertRow(self, table_name="", fields=[], values=[]):
+        """
+        Inserts a record into the chosen table.
+        The length of the fields and values MUST 
+        match inorder to insert a record.
+        """
+        if len(values) > 0 and len(fields) == len(values):
+            self.insertRows(table_name, fields, [values])
+
+    def updateValue(self, table_name="", field="", value=None, cond="", cond_val=None):
+        """ Updates the selected value in the record (only where cond = cond_val, if given)."""
+        try:
+            if self._connected_to_database and table_name != "" and field != "" and value != None:
+                if cond != "" and cond_val != None:
+                    self.execute(self._queries.update(table_name, field, cond), (value, cond_val))
+                else:
+                    self.execute(self._queries.update(table_name, field), (value,))
+                self._connection.commit()
+
+        except Exception as e:
+            print("Failed to update sqlite table: "+str(e))
+            self.closeDatabase()
+    # removeRow()
+    #
+    # -Removes a record from the chosen table. 
+    '''
+    *NOTE: ADD A REMOVE ALL FROM ID METHOD
+    '''
+    def removeRow(self, table_name="", word="", field="WORD"):
+        """ Removes the records of the selected table whose field (WORD by default) equals word."""
+        try:
+            if self._connected_to_database and table_name != "" and word != "":
+                self.execute(self._queries.delete(table_name, field), (word,))
+                self._connection.commit()
+           
+        except Exception as e:
+            print("Failed to remove row: "+str(e))
+            self.closeDatabase()
+
+    def removeIndexedRow(self, table_name="", row_id=None, index_table=""):
+        """
+        Removes the record with the row ID from a table and, only if it was there, the row with
+        the same rowid from its index table (e.g. full-text), in one transaction.
+        Returns the number of removed records.
+        """
+        try:
+            if self._connected_to_database and table_name != "" and row_id is not None:
+                with self._connection:
+                    removed = self.execute(self._queries.delete(table_name, "rowid"), (row_id,)).rowcount
+                    if removed and index_table != "":
+                        self.execute(self._queries.delete(index_table, "rowid"), (row_id,))
+                return removed
+        except Exception as e:
+            print("Failed to remove row: "+str(e))
+            self.closeDatabase()
+        return 0
+
+    def readRow(self, table_name="", row_id=-1):
+        """Returns a selected row."""
+        try:
+            if self._connected_to_database and (table_name !="" and row_id != -1):
+                rows = self.query(self._queries.select(table_name, cond="ID"), (row_id,))
+                return rows[0] if rows else None
+
+        except Exception as e:
+            print("Failed to read row: "+str(e))
+            self.closeDatabase()
+    
+    def getValuesFromField(self, table_name, field):
+        """ Returns values from a selected field."""
+        try:
+            if self._connected_to_database and (table_name != "" and field != ""):
+                values = [value[0] for value in self.query(self._queries.select(table_name, (field,)))]
+                return values
+
+        except Exception as e:
+            print("Failed to read row: "+str(e))
+            self.closeDatabase()
+    
+    def getCondValuesFromField(self, table_name, field, cond, cond_val):
+        """Returns values from a field with a specified condition value.""" 
+        try:
+            if self._connected_to_database and (table_name != "" and field != ""):
+                values = [value[0] for value in self.query(self._queries.select(table_name, (field,), cond), (cond_val,))]
+                return values
+
+        except Exception as e:
+            print("Failed to read row: "+str(e))
+            self.closeDatabase()
+    
+    def getValuesFrom2Fields(self, table_name, field_1, field_2):
+        """Returns values from two specified fields."""
+        try:
+            if self._connected_to_database and (table_name != "" and field_1 != "" and field_2 != ""):
+                values = self.query(self._queries.select(table_name, (field_1, field_2)))
+                return values
+
+        except Exception as e:
+            print("Failed to read row: "+str(e))
+            self.closeDatabase()
+    
+    def iterRows(self, sql_statement, parameters=(), batch_size=FETCH_BATCH_SIZE):
+        """
+        Generator over the rows of a query, fetched batch_size rows at a time on a
+        cursor of its own, so other queries can run while the rows are consumed.
+        """
+        if not self._connected_to_database:
+            return
+        cursor = self._connection.cursor()
+        caller = callerOf(sys._getframe(1))
+        # Only the time spent in sqlite3 counts, not the time the consumer spends between batches.
+        seconds = 0.0
+        row_count = 0
+        try:
+            start = perf_counter()
+            cursor.execute(sql_statement, parameters)
+            rows = cursor.fetchmany(batch_size)
+            seconds += perf_counter() - start
+            while rows:
+                row_count += len(rows)
+                yield from rows
+                start = perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                seconds += perf_counter() - start
+        finally:
+            cursor.close()
+            self._statement_stats.record(sql_statement, seconds, row_count, caller)
+
+    def iterTable(self, table_name="", batch_size=FETCH_BATCH_SIZE, order_by=None):
+        """Streams the entire contents of a table row by row."""
+        try:
+            if self._connected_to_database and table_name != "":
+                yield from self.iterRows(self._queries.select(table_name, order_by=order_by), batch_size=batch_size)
+        except Exception as e:
+            print("Failed to read table: "+str(e))
+
+    def iterField(self, table_name="", field="", batch_size=FETCH_BATCH_SIZE, order_by=None):
+        """Streams the values of a selected field."""
+        try:
+            if self._connected_to_database and table_name != "" and field != "":
+                for row in self.iterRows(self._queries.select(table_name, (field,), order_by=order_by), batch_size=batch_size):
+                    yield row[0]
+        except Exception as e:
+            print("Failed to read field: "+str(e))
+
+    def iterFields(self, table_name="", fields=[], batch_size=FETCH_BATCH_SIZE, order_by=None):
+        """Streams the value tuples of the selected fields."""
+        try:
+            if self._connected_to_database and table_name != "" and len(fields) > 0:
+                yield from self.iterRows(self._queries.select(table_name, fields, order_by=order_by), batch_size=batch_size)
+        except Exception as e:
+            print("Failed to read fields: "+str(e))
+
+    def readTable(self, table_name=""):
+        """Read the entire contents of a table."""
+        try:
+            table = []
+            if self._connected_to_database and table_name != "":
+                table = self.query(self._queries.select(table_name))
+                table = [row[1] for row in table]
+            
+        except Exception as e:
+            print("Failed to read table: "+str(e))
+            self.closeDatabase()
+            return table
+        return table
+
+    def createTable(self, table_name="", data={}):
+        """Create a new table into the database."""
+        item_count = len(data)
+        command = """CREATE TABLE """+table_name+"""(
+        ID INTEGER PRIMARY KEY,
+        """
+        temp_line = ""
+        try:
+            if self._connected_to_database and table_name != "" and len(data) > 0:
+                if not self._queries.isIdentifier(table_name) or not all(self._queries.isIdentifier(field) for field in data):
+                    raise sqlite3.Error("invalid table or field name")
+                if table_name not in self.readListOfTables():
+                    for field, value_and_prop in data.items():
+                        field_caps = field.upper()
+                        temp_line = temp_line+str(field_caps)
+                        temp_line = temp_line+" "+self.detectSQLType(value_and_prop["value"])
+                        if value_and_prop["is_not_null"]:
+                            temp_line = temp_line+" NOT NULL"
+                        if value_and_prop["is_unique"]:
+                            temp_line = temp_line+" UNIQUE"
+                        item_count -= 1
+                        # Don't add comma if last item. 
+                        if item_count > 0:
+                            temp_line = temp_line+","
+                        command = command+"\n"+temp_line
+                        temp_line = ""
+                    command = command+");"
+                    self.execute(command)
+                    self._connection.commit()
+                    self._queries.forget(table_name)
+                    print("Table {tn} created successfully.".format(tn=table_name))
+                else:
+                    print("Table {tn} already exists.".format(tn=table_name))
+
+        except sqlite3.Error as e:
+            print("Failed to create table {tn}: {err}".format(tn=table_name, err=str(e)))
+            self.closeDatabase()      
+
+    def removeTable(self, table_name=""):
+        """Removes a table from the database."""
+        try:
+            if self._connected_to_database and table_name != "":
+                if table_name in self.readListOfTables():
+                    self.execute("DROP TABLE {tn}".format(tn=table_name))
+                    self._queries.forget(table_name)
+                    print("Table {tn} removed successfully.".format(tn=table_name))
+                else:
+                    print("Table {tn} does not exist.".format(tn=table_name))
+        except Exception as e:
+            print("Failed to remove table: "+str(e))
+            self.closeDatabase()
+
+    def createFullTextTable(self, table_name="", fields=[]):
+        """Creates an FTS5 full-text table (if it does not exist yet), returns true on success."""
+        try:
+            if self._connected_to_database and table_name != "" and len(fields) > 0:
+                if not self._queries.isIdentifier(table_name) or not all(self._queries.isIdentifier(field) for field in fields):
+                    raise sqlite3.Error("invalid table or field name")
+                self.execute("CREATE VIRTUAL TABLE IF NOT EXISTS {tn} USING fts5({cn})".format(tn=table_name, cn=", ".join(fields)))
+                self._connection.commit()
+                self._queries.forget(table_name)
+                return True
+        except sqlite3.Error as e:
+            print("Failed to create full-text table {tn}: {err}".format(tn=table_name, err=str(e)))
+        return False
+
+    def copyRows(self, source_table="", source_fields=[], target_table="", target_fields=[], replace=False):
+        """Copies the source fields of every row into the target fields of another table (emptying it first if replace)."""
+        try:
+            if self._connected_to_database and source_table != "" and target_table != "":
+                with self._connection:
+                    if replace:
+                        self.execute(self._queries.delete(target_table))
+                    self.execute(self._queries.copy(target_table, target_fields, source_table, source_fields))
+                return self._cursor.rowcount
+        except Exception as e:
+            print("Failed to copy rows: "+str(e))
+            self.closeDatabase()
+        return 0
+
+    def countRows(self, table_name=""):
+        """Returns the number of rows in a table."""
+        try:
+            if self._connected_to_database and table_name != "":
+                return self.query(self._queries.aggregate("COUNT", table_name, "*"))[0][0]
+        except Exception as e:
+            print("Failed to count rows: "+str(e))
+            self.closeDatabase()
+        return 0
+
+    def fullTextSearch(self, table_name="", fields=[], query="", limit=50):
+        """Returns up to limit (fields..., snippet) rows of an FTS5 table ranked by relevance."""
+        try:
+            if self._connected_to_database and table_name != "" and query != "":
+                return self.query(self._queries.match(table_name, fields), (query, limit))
+        except Exception as e:
+            print("Failed to search table: "+str(e))
+        return []
+
+    def attachDatabase(self, database_location="", schema_name=""):
+        """Attaches another database file to the connection under schema_name, returns true on success."""
+        try:
+            if self._connected_to_database and database_location != "" and schema_name != "":
+                if not self._queries.isIdentifier(schema_name) or schema_name in ("main", "temp"):
+                    raise sqlite3.Error("invalid schema name")
+                self.execute("ATTACH DATABASE ? AS {sn}".format(sn=schema_name), (database_location,))
+                return True
+        except sqlite3.Error as e:
+            print("Failed to attach {db}: {err}".format(db=database_location, err=str(e)))
+        return False
+
+    def detachDatabase(self, schema_name=""):
+        """Detaches an attached database from the connection."""
+        try:
+            if self._connected_to_database and schema_name != "":
+                if not self._queries.isIdentifier(schema_name):
+                    raise sqlite3.Error("invalid schema name")
+                self.execute("DETACH DATABASE {sn}".format(sn=schema_name))
+                return True
+        except sqlite3.Error as e:
+            print("Failed to detach {sn}: {err}".format(sn=schema_name, err=str(e)))
+        return False
+
+    def attachedDatabases(self):
+        """Returns {schema name: file} of the databases attached to the connection."""
+        attached = {}
+        if self._connected_to_database:
+            attached = {name: file for _, name, file in self.query("PRAGMA database_list") if name not in ("main", "temp")}
+        return attached
+
+    def iterUnion(self, sources=[], table_name="", fields=[], cond=None, cond_val=None, batch_size=FETCH_BATCH_SIZE, order_by=None):
+        """
+        Streams the fields of the same table across several attached schemas in one query.
+        sources is a list of (schema name, source label) pairs, every row ends with the label
+        of the schema it came from.
+        """
+        try:
+            if self._connected_to_database and len(sources) > 0 and table_name != "" and len(fields) > 0:
+                parameters = []
+                for _, source in sources:
+                    parameters.append(source)
+                    if cond is not None:
+                        parameters.append(cond_val)
+                sql_statement = self._queries.union([schema_name for schema_name, _ in sources], table_name, fields, cond, order_by)
+                yield from self.iterRows(sql_statement, parameters, batch_size)
+        except Exception as e:
+            print("Failed to read the union: "+str(e))
+
+    # In-memory snapshots
+    #-----------------------------------------------------------------------------------------------
+    def snapshot(self):
+        """
+        Copies the open database into a new in-memory database with the sqlite3 backup API
+        and returns an SQLiteLib over the copy (with a connection manager of its own).
+        """
+        try:
+            if self._connected_to_database:
+                if self._connection.in_transaction:
+                    self._connection.commit()
+                memory_connection = sqlite3.connect(":memory:", check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+                start = perf_counter()
+                self._connection.backup(memory_connection)
+                self._record("-- backup to :memory:", perf_counter() - start, None)
+                manager = ConnectionManager()
+                manager.register(":memory:", memory_connection)
+                return SQLiteLib(":memory:", manager, statement_stats=self._statement_stats)
+        except sqlite3.Error as e:
+            print("Failed to copy the database into memory: "+str(e))
+        return None
+
+    def dataVersion(self):
+        """
+        Returns PRAGMA data_version of the connection, it changes whenever another connection
+        (or process) commits to the database, but not on this connection's own commits.
+        """
+        if self._connected_to_database:
+            return self.query("PRAGMA data_version")[0][0]
+        return None
+
+    # Maintenance
+    #-----------------------------------------------------------------------------------------------
+    def churn(self):
+        """Returns the number of rows changed in the database since its last maintenance."""
+        return self._connections.churn(self._database_location)
+
+    def resetChurn(self):
+        self._connections.resetChurn(self._database_location)
+
+    def databaseStats(self):
+        """Returns the page counts of the database and its size on disk in bytes (WAL file included)."""
+        stats = {}
+        try:
+            if self._connected_to_database:
+                for pragma in ("page_count", "page_size", "freelist_count"):
+                    stats[pragma] = self.query("PRAGMA {pr}".format(pr=pragma))[0][0]
+                stats["size"] = sum(os.path.getsize(location) for location in (self._database_location, self._database_location+"-wal")
+                                    if os.path.isfile(location))
+        except Exception as e:
+            print("Failed to read the database stats: "+str(e))
+        return stats
+
+    def vacuum(self):
+        """Rebuilds the database file without its free pages, returns true on success."""
+        try:
+            if self._connected_to_database:
+                if self._connection.in_transaction:
+                    self._connection.commit()
+                self.execute("VACUUM")
+                if self._connections.isWAL(self._database_location):
+                    # The rebuilt pages land in the WAL file, checkpoint them to really shrink the file.
+                    self.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                return True
+        except sqlite3.Error as e:
+            print("Failed to vacuum the database: "+str(e))
+        return False
+
+    def analyze(self):
+        """Gathers the table and index statistics used by the query planner."""
+        try:
+            if self._connected_to_database:
+                self.execute("ANALYZE")
+                self._connection.commit()
+                return True
+        except sqlite3.Error as e:
+            print("Failed to analyze the database: "+str(e))
+        return False
+
+    def optimize(self):
+        """Runs PRAGMA optimize, which only analyzes the tables whose statistics are stale."""
+        try:
+            if self._connected_to_database:
+                self.execute("PRAGMA optimize")
+                self._connection.commit()
+                return True
+        except sqlite3.Error as e:
+            print("Failed to optimize the database: "+str(e))
+        return False
+
+    def integrityCheck(self):
+        """Returns the integrity_check messages, ["ok"] for a healthy database."""
+        try:
+            if self._connected_to_database:
+                return [row[0] for row in self.query("PRAGMA integrity_check")]
+        except sqlite3.Error as e:
+            print("Failed to check the database integrity: "+str(e))
+            return [str(e)]
+        return []
+
+    def readListOfTables(self):
+        """ Returns a list of tables from the selected database."""
+        table_names = []
+        if self._connected_to_database:
+            table_names = [table[0] for table in self.query("SELECT name FROM sqlite_master WHERE type='table';")]
+        return table_names
+
+    # getNextRowID()
+    #
+    # -Returns the next row ID from the chosen table
+    #  to be inserted into. This row ID does not exist 
+    #  yet. 
+    def getNextRowID(self, table_name=""):
+        try:
+            """
+            Returns the next row ID from the chosen table
+            to be inserted into. This row ID does not exist 
+            yet.
+            """
+            next_row_id = None 
+            if table_name != "":
+                # First row of table, so there is no next row 
+                next_row_id = self.query(self._queries.aggregate("MAX", table_name, "ID"))[0][0] 
+                if next_row_id == None:
+                    return 1
+                
+        except Exception as e:
+            print("Failed to get the next row id: "+str(e))
+            return next_row_id 
+        return (next_row_id + 1)
+    
+    # getFirstRowID()
+    #
+    # -Returns the first row ID from the chosen table.
+    def getFirstRowID(self, table_name=""):
+        """Returns the first row ID from the chosen table."""
+        try:
+            first_row_id = None 
+            if table_name != "":
+                first_row_id = int(self.query(self._queries.aggregate("MIN", table_name, "ID"))[0][0])
+            return first_row_id
+                
+        except Exception as e:
+            print("Failded to get the first row id: "+str(e))
+        return first_row_id
+    
+    # getLastRowID()
+    #
+    # -Returns the last row ID from the chosen table.
+    def getLastRowID(self, table_name=""):
+        """Returns the last row ID from the chosen table."""
+        try:
+            last_row_id = None 
+            if table_name != "":
+                last_row_id = int(self.query(self._queries.aggregate("MAX", table_name, "ID"))[0][0]) 
+            return last_row_id
+                
+        except Exception as e:
+            print("Failed to get the last row id: "+str(e))
+        return last_row_id
+    # getLastInsertedRowID()
+    #
+    # -Returns the row ID that was last inserted into.
+    # This method will return None if table has not been
+    # used yet. 
+    def getLastInsertedRowID(self):
+        """
+        Returns the row ID that was last inserted into.
+        This method will return None if table has not been
+        used yet.
+        """
+        try:
+            return self._cursor.lastrowid
+        except Exception as e:
+            print("Failed to get last used row ID: "+str(e))
+
+
+    
@@ -0,0 +1,336 @@
+"""
+    Small benchmarks for the performance sensitive parts of Smart Notes.
+    Run from the repository root with: python python/sn_benchmarks.py
+"""
+
+import os
+import random
+import re
+import tempfile
+import threading
+from time import perf_counter, sleep
+
+from SQLiteLibrary import SQLiteLib, ConnectionManager
+from sn_dict_database import DefinitionsDatabase, DEFINITIONS_TABLE, wordKey
+from sn_prefix_index import (PrefixIndex, TermCounts)
+from sn_term_matcher import DictionaryTerms
+from sn_html_lexer import (States, lexHtml, HTML_TAGS)
+
+VOCABULARY = ("being", "time", "dialectic", "spirit", "reason", "world", "thing", "itself", "concept", "negation",
+              "understanding", "intuition", "category", "synthesis", "absolute", "care", "dasein", "history")
+
+def timed(function, *args):
+    """Returns the wall time of one call in seconds and the call's result."""
+    start = perf_counter()
+    result = function(*args)
+    return perf_counter() - start, result
+
+def glossaryRows(row_count):
+    """Generates fake (word, definition) glossary entries."""
+    for row in range(row_count):
+        yield ("Term{r}".format(r=row), "Definition of term number {r}, isn't it?".format(r=row))
+
+# Bulk inserts
+#---------------------------------------------------------------------------------------------------------
+def legacyInsert(database, row_count):
+    """The old insertRow path: SELECT MAX(ID), INSERT and commit for every single row."""
+    command = database.createSQLInsertCommand("G", ["WORD", "DEFINITION"])
+    for word, definition in glossaryRows(row_count):
+        database._cursor.execute(command, (database.getNextRowID("G"), word, definition))
+        database._connection.commit()
+
+def batchedInsert(database, row_count):
+    """The insertRows path: one executemany inside one transaction."""
+    database.insertRows("G", ["WORD", "DEFINITION"], glossaryRows(row_count))
+
+def benchmarkInserts(row_count=20000):
+    """Compares the per-row insert path with insertRows on an on-disk glossary."""
+    schema = {"WORD": {"value": "", "is_not_null": True, "is_unique": False},
+              "DEFINITION": {"value": "", "is_not_null": True, "is_unique": False}}
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, insert in (("legacy insertRow", legacyInsert), ("insertRows", batchedInsert)):
+            database = SQLiteLib(os.path.join(directory, name.replace(" ", "_")+".db"), ConnectionManager())
+            database.openDatabase()
+            database.createTable("G", schema)
+            seconds, _ = timed(insert, database, row_count)
+            results[name] = seconds
+            database.invalidateDatabase()
+    for name, seconds in results.items():
+        print("{nm:>18}: {rc} rows in {sec:.3f}s ({rps:.0f} rows/s)".format(nm=name, rc=row_count, sec=seconds, rps=row_count/seconds))
+    print("{sp:>18}: {x:.1f}x".format(sp="speed up", x=results["legacy insertRow"]/results["insertRows"]))
+    return results
+
+# Full-text search
+#---------------------------------------------------------------------------------------------------------
+def benchmarkFullTextSearch(definition_count=50000, queries=("dialectic", "spirit negation", "dase", "thing itself")):
+    """Times ranked full-text searches on a dictionary with definition_count definitions."""
+    generator = random.Random(0)
+    # The named terms are drowned in filler words so each appears in a fraction of the definitions.
+    vocabulary = list(VOCABULARY)+["filler{n}".format(n=n) for n in range(5000)]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        database = DefinitionsDatabase()
+        database.DATABASE_PATH = directory
+        database.setNewDatabase("Benchmark")
+        database.openDictionary()
+        rows = ((word, wordKey(word), " ".join(generator.choice(vocabulary) for _ in range(25)))
+                for word, _ in glossaryRows(definition_count))
+        database._database.insertRows(DEFINITIONS_TABLE, ["WORD", "WORD_KEY", "DEFINITION"], rows)
+        seconds, _ = timed(database.syncFullTextIndex)
+        print("{nm:>18}: {sec:.3f}s for {dc} definitions".format(nm="index build", sec=seconds, dc=definition_count))
+        database._database.closeDatabase()
+        for query in queries:
+            database.searchDefinitions(query)
+            seconds, hits = timed(database.searchDefinitions, query)
+            results[query] = seconds
+            print("{nm:>18}: {ms:.2f}ms, {ht} hit(s)".format(nm=query, ms=seconds*1000, ht=len(hits)))
+        database._database.invalidateDatabase()
+    return results
+
+# Union of several dictionaries
+#---------------------------------------------------------------------------------------------------------
+def benchmarkUnionLookups(dictionary_count=3, definition_count=5000, lookups=200):
+    """
+    Compares looking a word up in every dictionary by switching between them
+    (the old single dictionary mode) with one query on the ATTACHed union.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        database = DefinitionsDatabase()
+        database.DATABASE_PATH = directory
+        names = ["Glossary{n}".format(n=n) for n in range(dictionary_count)]
+        for name in names:
+            database.setNewDatabase(name)
+            database.openDictionary()
+            rows = ((word, wordKey(word), definition) for word, definition in glossaryRows(definition_count))
+            database._database.insertRows(DEFINITIONS_TABLE, ["WORD", "WORD_KEY", "DEFINITION"], rows)
+            database._database.closeDatabase()
+        words = ["Term{r}".format(r=r) for r in random.Random(0).sample(range(definition_count), lookups)]
+
+        def switching():
+            for word in words:
+                for name in names:
+                    database.setNewDatabase(name)
+                    database.getDefinition(word[0], word)
+
+        def union():
+            database.setUnionDatabases(names)
+            for word in words:
+                database.getDefinitionSources(word)
+            database.setUnionDatabases([])
+
+        for name, lookup in (("switching", switching), ("union", union)):
+            seconds, _ = timed(lookup)
+            results[name] = seconds
+            print("{nm:>18}: {lk} words in {dc} dictionaries in {sec:.3f}s".format(nm=name, lk=lookups, dc=dictionary_count, sec=seconds))
+        database._database.invalidateDatabase()
+    print("{sp:>18}: {x:.1f}x".format(sp="speed up", x=results["switching"]/results["union"]))
+    return results
+
+# In-memory snapshot
+#---------------------------------------------------------------------------------------------------------
+def benchmarkSnapshotLookups(definition_count=20000, lookups=2000):
+    """Compares definition lookups from the dictionary file with lookups from its in-memory snapshot."""
+    results = {}
+    words = ["Term{r}".format(r=r) for r in random.Random(0).sample(range(definition_count), lookups)]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, use_snapshot in (("file", False), ("snapshot", True)):
+            database = DefinitionsDatabase(use_snapshot=use_snapshot)
+            database.DATABASE_PATH = directory
+            database.setNewDatabase("Benchmark")
+            if name == "file":
+                database.openDictionary()
+                rows = ((word, wordKey(word), definition) for word, definition in glossaryRows(definition_count))
+                database._database.insertRows(DEFINITIONS_TABLE, ["WORD", "WORD_KEY", "DEFINITION"], rows)
+                database._database.closeDatabase()
+            # The first lookup opens the dictionary (and loads the snapshot).
+            database.getDefinition("T", words[0])
+            seconds, _ = timed(lambda: [database.getDefinition(word[0], word) for word in words])
+            results[name] = seconds
+            print("{nm:>18}: {lk} lookups in {sec:.3f}s ({us:.1f}us each)".format(nm=name, lk=lookups, sec=seconds, us=seconds/lookups*1e6))
+            database.dropSnapshot()
+            database._database.invalidateDatabase()
+    print("{sp:>18}: {x:.1f}x".format(sp="speed up", x=results["file"]/results["snapshot"]))
+    return results
+
+# Term completion
+#---------------------------------------------------------------------------------------------------------
+def benchmarkCompletion(term_count=100000, document_words=50000, prefixes=2000):
+    """
+    Times PrefixIndex.complete on a term_count term dictionary with the frequencies of a
+    document_words word document; a completion has to fit in one frame (16ms).
+    """
+    generator = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    terms = {"".join(generator.choice(letters) for _ in range(generator.randint(4, 12))) for _ in range(term_count)}
+    terms = [term.capitalize() for term in terms]
+    seconds, index = timed(PrefixIndex, terms)
+    print("{nm:>18}: {tc} terms in {sec:.3f}s".format(nm="index build", tc=len(index), sec=seconds))
+    words = [generator.choice(terms) if generator.random() < 0.2 else generator.choice(VOCABULARY) for _ in range(document_words)]
+    # Blocks of ten words, tokenized the way the highlighter hands them to TermCounts
+    blocks = [[(word, 0) for word in words[start:start + 10]] for start in range(0, len(words), 10)]
+    counts = TermCounts()
+    seconds, _ = timed(lambda: [counts.update(block_id, tokens) for block_id, tokens in enumerate(blocks)])
+    print("{nm:>18}: {dw} words in {ms:.1f}ms".format(nm="term count", dw=document_words, ms=seconds*1000))
+    seconds, _ = timed(counts.update, 0, blocks[-1])
+    print("{nm:>18}: {us:.1f}us".format(nm="block recount", us=seconds*1e6))
+    frequencies = counts.frequencies
+    timings = []
+    for _ in range(prefixes):
+        term = generator.choice(terms)
+        prefix = term[:generator.randint(2, 3)]
+        seconds, _ = timed(index.complete, prefix, frequencies, 10)
+        timings.append(seconds)
+    timings.sort()
+    results = {"p50": timings[len(timings)//2], "p99": timings[int(len(timings)*0.99)], "max": timings[-1]}
+    print("{nm:>18}: p50 {p50:.3f}ms, p99 {p99:.3f}ms, max {mx:.3f}ms".format(nm="completion", p50=results["p50"]*1000, p99=results["p99"]*1000, mx=results["max"]*1000))
+    return results
+
+# Dictionary term highlighting
+#---------------------------------------------------------------------------------------------------------
+def legacyTermRules(terms):
+    """The old highlighting rules: a \\b...\\b pattern for the term, its upper and its lower case."""
+    return [re.compile(r"\b" + re.escape(variant) + r"\b") for term in terms for variant in (term, term.upper(), term.lower())]
+
+def legacyHighlight(rules, block):
+    return sum(1 for rule in rules for _ in rule.finditer(block))
+
+def termHighlight(terms, block):
+    return sum(1 for _ in terms.findAll(block))
+
+def benchmarkTermHighlighting(term_counts=(100, 1000, 5000, 20000), blocks=200, legacy_max_terms=5000):
+    """
+    Times the dictionary term matching of one block (a paragraph) for growing dictionaries.
+    With DictionaryTerms the cost per block stays flat, the old per-term patterns grow with
+    the dictionary (python re stands in for QRegExp here, the scaling is the same).
+    """
+    generator = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = sorted({"".join(generator.choice(letters) for _ in range(generator.randint(4, 12))) for _ in range(max(term_counts))})
+    phrases = [" ".join(generator.sample(VOCABULARY, 3)) for _ in range(max(term_counts) // 10)]
+    paragraphs = [" ".join(generator.choice(words) if generator.random() < 0.1 else generator.choice(VOCABULARY) for _ in range(80)) for _ in range(blocks)]
+    results = {}
+    for term_count in term_counts:
+        terms = words[:term_count - term_count // 10] + phrases[:term_count // 10]
+        matcher = DictionaryTerms(terms)
+        seconds = sum(timed(termHighlight, matcher, block)[0] for block in paragraphs) / blocks
+        legacy = None
+        if term_count <= legacy_max_terms:
+            rules = legacyTermRules(terms)
+            legacy = sum(timed(legacyHighlight, rules, block)[0] for block in paragraphs[:20]) / 20
+        results[term_count] = (seconds, legacy)
+        print("{nm:>18}: {tc:>5} terms, {us:.1f}us per block{lg}".format(nm="term highlighting", tc=term_count, us=seconds*1e6,
+            lg=", regex rules {ms:.2f}ms".format(ms=legacy*1000) if legacy is not None else ""))
+    return results
+
+# HTML highlighting
+#---------------------------------------------------------------------------------------------------------
+def htmlTable(row_count):
+    """Lines of a pasted HTML table with attributes, quotes and a comment per row."""
+    lines = ['<table class="glossary" style="width:100%">']
+    for row in range(row_count):
+        lines.append('  <tr id="row{r}"><td class="term">Term{r}</td><td style="color:#333">Definition of <b>term</b> {r}</td></tr> <!-- row {r} -->'.format(r=row))
+    lines.append("</table>")
+    return lines
+
+def legacyHtmlRules():
+    """The old per-block scans: a start and an end tag pattern for every tag name (python re stands in for QRegExp)."""
+    return [re.compile("<" + prefix + r"\b" + re.escape(tag) + r"\b") for tag in HTML_TAGS for prefix in ("", "/")]
+
+def legacyHtmlHighlight(rules, lines):
+    return sum(1 for line in lines for rule in rules for _ in rule.finditer(line))
+
+def lexHtmlLines(lines, tags=HTML_TAGS):
+    state = States.NONE
+    spans = 0
+    for line in lines:
+        line_spans, state = lexHtml(line, state, tags)
+        spans += len(line_spans)
+    return spans
+
+def benchmarkHtmlHighlighting(row_counts=(250, 1000, 4000), vocabulary_factor=20):
+    """
+    Times the HTML highlighting of a pasted table of growing size: the lexer's time per KB stays
+    the same, and a tag vocabulary vocabulary_factor times bigger does not change it.
+    """
+    rules = legacyHtmlRules()
+    big_vocabulary = HTML_TAGS | {"{t}{n}".format(t=tag, n=copy) for tag in HTML_TAGS for copy in range(vocabulary_factor)}
+    results = {}
+    for row_count in row_counts:
+        lines = htmlTable(row_count)
+        kilobytes = sum(len(line) + 1 for line in lines) / 1024
+        seconds, _ = timed(lexHtmlLines, lines)
+        big_seconds, _ = timed(lexHtmlLines, lines, big_vocabulary)
+        legacy_seconds, _ = timed(legacyHtmlHighlight, rules, lines)
+        results[row_count] = (seconds, big_seconds, legacy_seconds)
+        print("{nm:>18}: {kb:.0f}KB, lexer {ms:.1f}ms ({us:.0f}us/KB), {tc} tags {bms:.1f}ms, regex rules {lms:.1f}ms".format(
+            nm="html highlighting", kb=kilobytes, ms=seconds * 1000, us=seconds * 1e6 / kilobytes,
+            tc=len(big_vocabulary), bms=big_seconds * 1000, lms=legacy_seconds * 1000))
+    return results
+
+# Concurrent readers and a writer (WAL)
+#---------------------------------------------------------------------------------------------------------
+def stressReadersAndWriter(reader_count=4, seconds=2.0):
+    """
+    Runs reader threads (through the read-only pool) against a writer thread inserting
+    into the same WAL database, and reports how many operations each of them completed.
+    """
+    schema = {"WORD": {"value": "", "is_not_null": True, "is_unique": False},
+              "DEFINITION": {"value": "", "is_not_null": True, "is_unique": False}}
+    stop = threading.Event()
+    progress = {}
+    errors = []
+    with tempfile.TemporaryDirectory() as directory:
+        manager = ConnectionManager()
+        writer = SQLiteLib(os.path.join(directory, "stress.db"), manager, use_wal=True)
+        writer.openDatabase()
+        writer.createTable("G", schema)
+        writer.insertRows("G", ["WORD", "DEFINITION"], glossaryRows(1000))
+
+        def write():
+            batch = 0
+            while not stop.is_set():
+                if not writer.insertRows("G", ["WORD", "DEFINITION"], glossaryRows(50)):
+                    errors.append("writer batch {bt} failed".format(bt=batch))
+                batch += 1
+            progress["writer"] = batch
+
+        def read(name):
+            reads = 0
+            while not stop.is_set():
+                try:
+                    with writer.reading() as reader:
+                        reader.countRows("G")
+                        reader.getCondValuesFromField("G", "DEFINITION", "WORD", "Term{r}".format(r=reads % 1000))
+                    reads += 1
+                except Exception as e:
+                    errors.append("{nm}: {err}".format(nm=name, err=e))
+            progress[name] = reads
+
+        threads = [threading.Thread(target=write)]
+        threads.extend(threading.Thread(target=read, args=("reader {n}".format(n=n),)) for n in range(reader_count))
+        for thread in threads:
+            thread.start()
+        sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print("{nm:>18}: {ct} rows after {sec}s".format(nm="table", ct=writer.countRows("G"), sec=seconds))
+        writer.invalidateDatabase()
+    for name, count in progress.items():
+        print("{nm:>18}: {ct} {kind}".format(nm=name, ct=count, kind="batches" if name == "writer" else "reads"))
+    for error in errors[:10]:
+        print("{nm:>18}: {err}".format(nm="error", err=error))
+    print("{nm:>18}: {ok}".format(nm="all progressed", ok=all(progress.values()) and not errors))
+    return progress
+
+if __name__ == "__main__":
+    benchmarkInserts()
+    benchmarkFullTextSearch()
+    benchmarkUnionLookups()
+    benchmarkSnapshotLookups()
+    benchmarkCompletion()
+    benchmarkTermHighlighting()
+    benchmarkHtmlHighlighting()
+    stressReadersAndWriter()
@@ -0,0 +1,136 @@
+from PySide2.QtCore import (QObject, Signal)
+from concurrent.futures import ThreadPoolExecutor
+from SQLiteLibrary import FETCH_BATCH_SIZE
+import threading
+
+class DatabaseWorker(QObject):
+    """
+    Asynchronous facade over DefinitionsDatabase. A single dedicated worker thread owns the
+    dictionary connections and runs the calls one after the other (so they keep their order),
+    results are handed back to the GUI thread through a Qt signal.
+
+    Requests can be given a channel (e.g. "definition"). A new request on a channel cancels
+    the one still in flight on it, and results of cancelled requests are never delivered.
+    """
+    # (kind, request id, channel, callback, payload) emitted from the worker thread.
+    _result = Signal(object)
+
+    def __init__(self, database, parent=None):
+        super().__init__(parent)
+        self._database = database
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dictionary")
+        self._lock = threading.Lock()
+        self._next_request_id = 0
+        self._latest_requests = {}
+        self._futures = {}
+        # Queued to the GUI thread, since that is where this object lives.
+        self._result.connect(self._deliver)
+
+    def _newRequest(self, channel):
+        with self._lock:
+            self._next_request_id += 1
+            request_id = self._next_request_id
+            if channel is not None:
+                self._latest_requests[channel] = request_id
+                previous_future = self._futures.pop(channel, None)
+                if previous_future is not None:
+                    previous_future.cancel()
+        return request_id
+
+    def isCurrent(self, channel, request_id):
+        """Returns true if the request is still the latest one of its channel."""
+        if channel is None:
+            return True
+        with self._lock:
+            return self._latest_requests.get(channel) == request_id
+
+    def cancel(self, channel):
+        """Cancels the request in flight on a channel, its result will not be delivered."""
+        self._newRequest(channel)
+
+    def submit(self, method_name, *args, callback=None, channel=None):
+        """
+        Queues DefinitionsDatabase.method_name(*args) on the worker thread. The callback
+        is called on the GUI thread with the result. Returns a concurrent Future.
+        """
+        request_id = self._newRequest(channel)
+
+        def run():
+            if not self.isCurrent(channel, request_id):
+                return None
+            try:
+                result = getattr(self._database, method_name)(*args)
+            except Exception as e:
+                print("Dictionary request {mn} failed: {err}".format(mn=method_name, err=e))
+                raise
+            if callback is not None:
+                self._result.emit(("result", request_id, channel, callback, result))
+            return result
+
+        future = self._executor.submit(run)
+        if channel is not None:
+            with self._lock:
+                if self._latest_requests.get(channel) == request_id:
+                    self._futures[channel] = future
+        return future
+
+    def stream(self, method_name, *args, batch_callback=None, done_callback=None, channel=None, batch_size=FETCH_BATCH_SIZE):
+        """
+        Queues a generator method of DefinitionsDatabase and hands its items to batch_callback
+        (on the GUI thread) in lists of batch_size, then calls done_callback. The generator is
+        closed as soon as a newer request on the same channel makes this one stale.
+        """
+        request_id = self._newRequest(channel)
+
+        def run():
+            if not self.isCurrent(channel, request_id):
+                return
+            items = getattr(self._database, method_name)(*args)
+            batch = []
+            try:
+                for item in items:
+                    batch.append(item)
+                    if len(batch) == batch_size:
+                        if not self.isCurrent(channel, request_id):
+                            return
+                        if batch_callback is not None:
+                            self._result.emit(("result", request_id, channel, batch_callback, batch))
+                        batch = []
+                if batch and batch_callback is not None:
+                    self._result.emit(("result", request_id, channel, batch_callback, batch))
+                if done_callback is not None:
+                    self._result.emit(("done", request_id, channel, done_callback, None))
+            except Exception as e:
+                print("Dictionary stream {mn} failed: {err}".format(mn=method_name, err=e))
+            finally:
+                if hasattr(items, "close"):
+                    items.close()
+
+        future = self._executor.submit(run)
+        if channel is not None:
+            with self._lock:
+                if self._latest_requests.get(channel) == request_id:
+                    self._futures[channel] = future
+        return future
+
+    def post(self, callback, payload):
+        """Hands a payload to callback on the GUI thread, can be called from any thread."""
+        self._result.emit(("result", None, None, callback, payload))
+
+    def _deliver(self, message):
+        kind, request_id, channel, callback, payload = message
+        if not self.isCurrent(channel, request_id):
+            return
+        if kind == "done":
+            callback()
+        else:
+            callback(payload)
+
+    def shutdown(self):
+        """Drops the queued requests and stops the worker thread once the running one is done."""
+        with self._lock:
+            self._latest_requests.clear()
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -1,134 +1,591 @@
-from SQLiteLibrary import SQLiteLib, SQLTypes
-import os 
-
-# Default dictionary selection for testing purposes. 
-DATABASE_NAME = "Heidegger.db"
-
-class DefinitionsDatabase:
-    """ A specialized "Definition Dictionary" SQL handler built on top of my "SQLiteLibrary"."""
-    def __init__(self):
-        self.DATABASE_PATH = "dictionary_databases"
-        self._database_location = '/'.join([self.DATABASE_PATH, DATABASE_NAME])
-        self._database = SQLiteLib()
-        
-    def setNewDatabase(self, database_location):
-        """ Sets the new active dictionary."""
-        if not database_location.endswith('.db'):
-            database_location = '.'.join([database_location, 'db']) 
-        f_database_location = '/'.join([self.DATABASE_PATH, database_location])
-        self._database_location = f_database_location
-    
-    def addNewDatabase(self, database_name):
-        """ Adds a new dictionary database."""
-        try:
-            database_names = [database_name.split(".")[0] for database_name in os.listdir(self.DATABASE_PATH)]
-            if database_name not in database_names:
-                self._database.createNewDatabase(database_name)
-        except Exception as e:
-            print("Failed to create a new database:",e)
-    
-    def getDatabaseNames(self):
-        """Returns a list of dictionary names."""
-        try:
-            return [database_name.split(".")[0] for database_name in os.listdir(self.DATABASE_PATH)]
-        except Exception as e:
-            print("Failed to get database names:",e)
-
-    def getAllDictWords(self):
-        """Returns a list of all the words contained in the selected dictionary."""
-        words = []
-        try:
-            self._database.openDatabase(self._database_location)
-            for letter in self._database.readListOfTables():
-                words.extend(self._database.readTable(letter))
-            return words 
-        except Exception as e:
-            print(e)
-        finally:
-            self._database.closeDatabase()
-        return words  
-    
-    def checkIfLetterExists(self, letter):
-        """ Checks if the database contains a letter table for the word being entered."""
-        try:
-            letter = letter.upper()
-            self._database.openDatabase(self._database_location)
-            return (letter in self._database.readListOfTables())
-        except Exception as e:
-            print(e)
-            return False 
-
-        finally:
-            self._database.closeDatabase() 
-        return False 
-
-    def addDefinition(self, letter, word, defintion):
-        """Adds a new definition into the selected dictionary."""
-        try:
-            self._database.openDatabase(self._database_location)
-            letter = letter.upper()
-            self._database.insertRow(letter, ["WORD", "DEFINITION"], [word, defintion])
-        except Exception as e:
-            print("Failed to add defintion to dictionary:",e)
-        finally:
-            self._database.closeDatabase() 
-
-    def updateDefinition(self, letter, word, definition):
-        """Updates the current selected definition word.""" 
-        try:
-            self._database.openDatabase(self._database_location)
-            letter = letter.upper()
-            self._database.updateValue(self, letter, word, definition)
-
-        except Exception as e:
-            print("Failed to update defintion in dictionary:",e)
-            return False 
-        finally:
-            self._database.closeDatabase() 
-        return False 
-
-    def removeDefinition(self, letter, word):
-        """Removes the selected word from the dictionary database."""
-        try:
-            self._database.openDatabase(self._database_location)
-            letter = letter.upper()
-            self._database.removeRow(letter, word)
-        except Exception as e:
-            print("Failed to remove defintion from dictionary:",e)
-        finally:
-            self._database.closeDatabase() 
-
-    def getDefinition(self, letter, word):
-        """Returns the word selected definition from the dictionary as a string."""
-        try:
-            definition = None 
-            self._database.openDatabase(self._database_location)
-            definition = self._database.getCondValuesFromField(letter, "DEFINITION", "WORD", word)
-            if definition:
-                definition = definition[0]
-            return definition
-        except Exception as e:
-            print(e)
-        finally:
-            self._database.closeDatabase() 
-
-    def insertNewTableLetter(self, letter):
-        """Inserts a new letter table into the dictionary database."""
-        try:
-            if len(letter) == 1:
-                letter_caps = letter.upper()
-                definition = {"WORD": {"value": "", "is_not_null": True, "is_unique": False},
-                             "DEFINITION": {"value": "", "is_not_null": True, "is_unique": False}}
-                self._database.openDatabase(self._database_location)
-                self._database.createTable(letter_caps, definition)
-            else:
-                print("Incorrect input, must be a letter for new table entry.")
-
-        
-        except Exception as e:
-            print("Failed to insert a new table letter:", e)
-        
-        finally:
-            if self._database._connection:
-                self._database.closeDatabase()
-
+from SQLiteLibrary import SQLiteLib, SQLTypes, FETCH_BATCH_SIZE
+import os 
+from contextlib import contextmanager
+import re
+import threading
+from time import perf_counter, monotonic
+
+# Default dictionary selection for testing purposes. 
+DATABASE_NAME = "Heidegger.db"
+
+# Every definition lives in this one table. WORD_KEY holds the case-folded word,
+# its UNIQUE constraint gives us the index used by the lookups.
+DEFINITIONS_TABLE = "definitions"
+DEFINITIONS_SCHEMA = {"WORD": {"value": "", "is_not_null": True, "is_unique": False},
+                      "WORD_KEY": {"value": "", "is_not_null": True, "is_unique": True},
+                      "DEFINITION": {"value": "", "is_not_null": True, "is_unique": False}}
+
+# FTS5 index over the definitions, its rowid is the ID of the definitions row.
+FULL_TEXT_TABLE = "definitions_fts"
+FULL_TEXT_FIELDS = ["WORD", "DEFINITION"]
+
+# Name of the merged view of every dictionary in the dictionary selection.
+UNION_DICTIONARY = "All Dictionaries"
+
+# Maintenance tasks, see DefinitionsDatabase.runMaintenance.
+MAINTENANCE_TASKS = ("integrity_check", "vacuum", "analyze", "optimize")
+
+# How often (in seconds) the in-memory snapshot checks whether the dictionary file changed underneath.
+SNAPSHOT_CHECK_SECONDS = 1.0
+
+# Markers the full-text snippets use around the matched terms.
+SNIPPET_START = "\x01"
+SNIPPET_END = "\x02"
+
+def listDatabaseNames(database_path):
+    """Returns the names of the dictionary (.db) files in a folder, ignoring the WAL side files."""
+    return [file_name[:-len(".db")] for file_name in os.listdir(database_path) if file_name.endswith(".db")]
+
+def wordKey(word):
+    """Returns the case-folded key a word is stored and looked up under."""
+    return word.casefold()
+
+def dictionaryName(database_location):
+    """Returns the dictionary name of a dictionary file location (e.g. "Kant")."""
+    return os.path.splitext(os.path.basename(database_location))[0]
+
+def isLetterTable(table_name):
+    """Returns true for the per-letter tables of the old dictionary layout."""
+    return len(table_name) == 1 and table_name.isalpha()
+
+def fullTextQuery(text):
+    """Turns typed text into an FTS5 query, every word must match and the last one may be a prefix."""
+    terms = ['"{t}"'.format(t=term) for term in re.findall(r"\w+", text)]
+    if terms:
+        terms[-1] = terms[-1]+"*"
+    return " ".join(terms)
+
+class DefinitionsDatabase:
+    """ A specialized "Definition Dictionary" SQL handler built on top of my "SQLiteLibrary"."""
+    def __init__(self, use_snapshot=False):
+        self.DATABASE_PATH = "dictionary_databases"
+        self._database_location = '/'.join([self.DATABASE_PATH, DATABASE_NAME])
+        # WAL mode, so that reads go through the read-only pool without blocking the writes.
+        self._database = SQLiteLib(use_wal=True)
+        # Dictionary locations already checked for the single table layout.
+        self._checked_schemas = set()
+        # Union mode: the other dictionaries attached to the active one, {schema name: location}.
+        self._union_locations = []
+        self._attached = {}
+        # Snapshot mode: reads are served by an in-memory copy of the active dictionary.
+        self._snapshot_mode = use_snapshot
+        self._snapshot = None
+        self._snapshot_location = None
+        self._snapshot_source = None
+        self._snapshot_version = None
+        self._snapshot_checked = 0.0
+        self._snapshot_depth = 0
+        self._snapshot_lock = threading.RLock()
+        
+    def databaseLocation(self, database_location):
+        """Returns the full location of a dictionary name or file name."""
+        if not database_location.endswith('.db'):
+            database_location = '.'.join([database_location, 'db']) 
+        return '/'.join([self.DATABASE_PATH, database_location])
+        
+    def setNewDatabase(self, database_location):
+        """
+        Sets the new active dictionary. In union mode this is the dictionary new
+        definitions are written to, the union itself stays in place.
+        """
+        f_database_location = self.databaseLocation(database_location)
+        if f_database_location != self._database_location:
+            # Drop the long-lived connection of the dictionary we are leaving (and its attachments).
+            self._database.invalidateDatabase(self._database_location)
+            self._attached = {}
+            self.dropSnapshot()
+        self._database_location = f_database_location
+
+    def setUnionDatabases(self, database_names):
+        """
+        Merges several dictionaries into one view: they are ATTACHed to the connection of
+        the active dictionary and read with a single query. An empty list leaves union mode.
+        """
+        self._union_locations = [self.databaseLocation(database_name) for database_name in database_names]
+
+    def setSnapshotMode(self, enabled):
+        """
+        Turns the in-memory snapshot on/off. When on, the active dictionary is copied into
+        memory (sqlite3 backup API) when it is opened, reads are served from the copy and
+        writes go to both the file and the copy.
+        """
+        self._snapshot_mode = enabled
+        if not enabled:
+            self.dropSnapshot()
+
+    def isSnapshot(self):
+        """Returns true if the snapshot mode is on."""
+        return self._snapshot_mode
+
+    def dropSnapshot(self):
+        """Discards the in-memory copy, the next read loads a fresh one."""
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                self._snapshot.invalidateDatabase()
+            self._snapshot = None
+            self._snapshot_location = None
+            self._snapshot_source = None
+
+    def loadSnapshot(self):
+        """Copies the open dictionary into memory."""
+        with self._snapshot_lock:
+            self.dropSnapshot()
+            start = perf_counter()
+            self._snapshot = self._database.snapshot()
+            if self._snapshot is not None:
+                self._snapshot_location = self._database_location
+                self._snapshot_source = self._database._connection
+                self._snapshot_version = self._database.dataVersion()
+                self._snapshot_checked = monotonic()
+                print("Loaded {db} into memory in {ms:.1f}ms.".format(db=self._database_location, ms=(perf_counter() - start) * 1000))
+            return self._snapshot
+
+    def isSnapshotStale(self):
+        """
+        Returns true if the dictionary file was changed by another connection since the
+        copy was made (checked at most every SNAPSHOT_CHECK_SECONDS).
+        """
+        if self._snapshot_location != self._database_location or self._snapshot_source is not self._database._connection:
+            return True
+        if monotonic() - self._snapshot_checked < SNAPSHOT_CHECK_SECONDS:
+            return False
+        self._snapshot_checked = monotonic()
+        return self._database.dataVersion() != self._snapshot_version
+
+    def currentSnapshot(self):
+        """Returns the up to date in-memory copy of the open dictionary (loading it if needed), None if off."""
+        if not self._snapshot_mode or self.isUnion():
+            return None
+        with self._snapshot_lock:
+            if self._snapshot is None or self.isSnapshotStale():
+                self.loadSnapshot()
+            return self._snapshot
+
+    @contextmanager
+    def reading(self):
+        """
+        Yields the SQLiteLib reads of the open dictionary go to: the in-memory snapshot
+        when it is on, otherwise one of the pooled read-only connections.
+        """
+        snapshot = self.currentSnapshot()
+        if snapshot is None:
+            with self._database.reading() as reader:
+                yield reader
+            return
+        with self._snapshot_lock:
+            if self._snapshot_depth == 0:
+                snapshot.openDatabase()
+            self._snapshot_depth += 1
+            try:
+                yield snapshot
+            finally:
+                self._snapshot_depth -= 1
+                if self._snapshot_depth == 0:
+                    snapshot.closeDatabase()
+
+    @contextmanager
+    def writing(self):
+        """Yields the copies of the open dictionary a write goes to: the file and, if loaded, the snapshot."""
+        with self._snapshot_lock:
+            targets = [self._database]
+            if self._snapshot is not None:
+                if self.isSnapshotStale():
+                    # Reloaded (with this write in it) by the next read.
+                    self.dropSnapshot()
+                else:
+                    targets.append(self._snapshot)
+                    if self._snapshot_depth == 0:
+                        self._snapshot.openDatabase()
+            try:
+                yield targets
+            finally:
+                if len(targets) > 1 and self._snapshot_depth == 0:
+                    self._snapshot.closeDatabase()
+
+    def isUnion(self):
+        """Returns true if the dictionaries are merged into one view."""
+        return bool(self._union_locations)
+
+    def unionSources(self):
+        """Returns the (schema name, dictionary name) pairs the union reads from, the active dictionary first."""
+        sources = [("main", dictionaryName(self._database_location))]
+        sources.extend((schema_name, dictionaryName(location)) for schema_name, location in self._attached.items())
+        return sources
+
+    def prepareDictionary(self, database_location):
+        """Migrates a dictionary that is not the active one, so it can be attached to the union."""
+        if database_location in self._checked_schemas:
+            return
+        dictionary = DefinitionsDatabase()
+        dictionary.DATABASE_PATH = self.DATABASE_PATH
+        dictionary._database_location = database_location
+        try:
+            dictionary.openDictionary()
+            self._checked_schemas.add(database_location)
+        finally:
+            # Its own connection is not needed, the union reads it through the attachment.
+            dictionary._database.invalidateDatabase(database_location)
+
+    def attachUnionDatabases(self):
+        """Attaches (and detaches) dictionaries so the open connection matches the union."""
+        wanted = [location for location in self._union_locations if location != self._database_location]
+        for schema_name, location in list(self._attached.items()):
+            if location not in wanted and self._database.detachDatabase(schema_name):
+                del self._attached[schema_name]
+        for location in wanted:
+            if location in self._attached.values() or not os.path.isfile(location):
+                continue
+            self.prepareDictionary(location)
+            schema_name = "dictionary_{n}".format(n=len(self._attached))
+            while schema_name in self._attached:
+                schema_name = schema_name+"_"
+            if self._database.attachDatabase(location, schema_name):
+                self._attached[schema_name] = location
+
+    def connectionStats(self):
+        """Returns the connection counts and reuse hit rate of the dictionary connections."""
+        return self._database.connectionStats()
+
+    def queryCacheStats(self):
+        """Returns the size and hit rate of the dictionary's built statement cache."""
+        return self._database.queryCacheStats()
+
+    def openDictionary(self):
+        """Opens the active dictionary, migrating it to the single table layout the first time."""
+        self._database.openDatabase(self._database_location)
+        if self._database_location not in self._checked_schemas:
+            self.migrateDatabase()
+            self.syncFullTextIndex()
+            self._checked_schemas.add(self._database_location)
+        if self._union_locations or self._attached:
+            self.attachUnionDatabases()
+        if self._snapshot_mode:
+            # Loaded when the dictionary is selected, reads never go to disk afterwards.
+            self.currentSnapshot()
+
+    def syncFullTextIndex(self):
+        """Creates the full-text index of the open dictionary, rebuilding it if it is out of step."""
+        if not self._database.createFullTextTable(FULL_TEXT_TABLE, FULL_TEXT_FIELDS):
+            return
+        if self._database.countRows(FULL_TEXT_TABLE) != self._database.countRows(DEFINITIONS_TABLE):
+            self._database.copyRows(DEFINITIONS_TABLE, ["ID"]+FULL_TEXT_FIELDS, FULL_TEXT_TABLE, ["rowid"]+FULL_TEXT_FIELDS, replace=True)
+
+    def hasFullTextIndex(self, database=None):
+        database = database or self._database
+        return FULL_TEXT_TABLE in database.readListOfTables()
+
+    def definitionID(self, word, database=None):
+        """Returns the row ID of a word in the open dictionary (or the given copy of it), or None."""
+        database = database or self._database
+        row_ids = database.getCondValuesFromField(DEFINITIONS_TABLE, "ID", "WORD_KEY", wordKey(word))
+        if row_ids:
+            return row_ids[0]
+        return None
+
+    def migrateDatabase(self):
+        """
+        One-shot migration of the open dictionary from one table per initial letter
+        into the single indexed definitions table. Returns the number of migrated words.
+        """
+        migrated = 0
+        tables = self._database.readListOfTables()
+        letter_tables = [table for table in tables if isLetterTable(table)]
+        if DEFINITIONS_TABLE in tables and not letter_tables:
+            return migrated
+
+        self._database.createTable(DEFINITIONS_TABLE, DEFINITIONS_SCHEMA)
+        known_keys = set(self._database.getValuesFromField(DEFINITIONS_TABLE, "WORD_KEY") or [])
+
+        def uniqueRows(letter_rows, counter):
+            for word, definition in letter_rows:
+                key = wordKey(word)
+                if key in known_keys:
+                    print("Skipping duplicate definition while migrating:", word)
+                    continue
+                known_keys.add(key)
+                counter[0] += 1
+                yield (word, key, definition)
+
+        for letter in letter_tables:
+            letter_rows = self._database.getValuesFrom2Fields(letter, "WORD", "DEFINITION") or []
+            counter = [0]
+            inserted = self._database.insertRows(DEFINITIONS_TABLE, ["WORD", "WORD_KEY", "DEFINITION"], uniqueRows(letter_rows, counter))
+            if inserted != counter[0]:
+                # Keep the letter table so nothing is lost, the next open retries it.
+                print("Failed to migrate table {lt}, it was left in place.".format(lt=letter))
+                continue
+            migrated += inserted
+            self._database.removeTable(letter)
+        print("Migrated {ct} definition(s) in {db}.".format(ct=migrated, db=self._database_location))
+        return migrated
+    
+    def addNewDatabase(self, database_name):
+        """ Adds a new dictionary database."""
+        try:
+            database_names = listDatabaseNames(self.DATABASE_PATH)
+            if database_name not in database_names:
+                self._database.createNewDatabase(database_name)
+        except Exception as e:
+            print("Failed to create a new database:",e)
+    
+    @contextmanager
+    def maintaining(self, database_name):
+        """
+        Yields the SQLiteLib of a dictionary for maintenance, the active one shares the
+        dictionary connection, any other one gets a connection that is closed afterwards.
+        """
+        location = self.databaseLocation(database_name)
+        database = self._database if location == self._database_location else SQLiteLib(location, use_wal=True)
+        try:
+            database.openDatabase(location)
+            yield database
+        finally:
+            database.closeDatabase()
+            if database is not self._database:
+                database.invalidateDatabase()
+
+    def maintenanceStatus(self, database_name):
+        """Returns the churn, page counts, size and whether the statistics were ever gathered of a dictionary."""
+        status = {"database": database_name}
+        try:
+            with self.maintaining(database_name) as database:
+                status.update(database.databaseStats())
+                status["churn"] = database.churn()
+                status["analyzed"] = "sqlite_stat1" in database.readListOfTables()
+        except Exception as e:
+            print("Failed to read the maintenance status:", e)
+        return status
+
+    def runMaintenance(self, database_name, task):
+        """
+        Runs one maintenance task (see MAINTENANCE_TASKS) on a dictionary and returns a report
+        with its result, the size of the dictionary before and after and the time it took.
+        A task that could not run has its message under "error" instead of a result.
+        """
+        report = {"database": database_name, "task": task}
+        start = perf_counter()
+        try:
+            if task not in MAINTENANCE_TASKS:
+                raise ValueError("Unknown maintenance task: {tk}".format(tk=task))
+            with self.maintaining(database_name) as database:
+                report["size_before"] = database.databaseStats().get("size", 0)
+                start = perf_counter()
+                if task == "integrity_check":
+                    report["result"] = database.integrityCheck()
+                else:
+                    report["result"] = getattr(database, task)()
+                    # Vacuum and the statistics take the changes so far into account.
+                    database.resetChurn()
+                report["seconds"] = perf_counter() - start
+                report["size_after"] = database.databaseStats().get("size", 0)
+        except Exception as e:
+            print("Failed to run the dictionary maintenance:", e)
+            report["error"] = str(e)
+        finally:
+            report.setdefault("seconds", perf_counter() - start)
+        return report
+    
+    def getDatabaseNames(self):
+        """Returns a list of dictionary names."""
+        try:
+            return listDatabaseNames(self.DATABASE_PATH)
+        except Exception as e:
+            print("Failed to get database names:",e)
+
+    def getAllDictWords(self):
+        """Returns a list of all the words contained in the selected dictionary."""
+        words = []
+        try:
+            if self.isUnion():
+                return list(self.iterAllDictWords())
+            self.openDictionary()
+            with self.reading() as reader:
+                words = reader.getValuesFromField(DEFINITIONS_TABLE, "WORD") or []
+            return words 
+        except Exception as e:
+            print(e)
+        finally:
+            self._database.closeDatabase()
+        return words  
+    
+    def iterAllDictWords(self, batch_size=FETCH_BATCH_SIZE):
+        """
+        Streams the words of the selected dictionary in case-insensitive alphabetical
+        order (the order of the WORD_KEY index), fetching batch_size words at a time.
+        """
+        try:
+            self.openDictionary()
+            if self.isUnion():
+                # A word found in several dictionaries is listed once.
+                last_key = None
+                for word, key, _ in self._database.iterUnion(self.unionSources(), DEFINITIONS_TABLE, ["WORD", "WORD_KEY"], batch_size=batch_size, order_by="WORD_KEY"):
+                    if key != last_key:
+                        last_key = key
+                        yield word
+                return
+            with self.reading() as reader:
+                yield from reader.iterField(DEFINITIONS_TABLE, "WORD", batch_size, order_by="WORD_KEY")
+        except Exception as e:
+            print("Failed to read the dictionary words:", e)
+        finally:
+            self._database.closeDatabase()
+
+    def checkIfLetterExists(self, letter):
+        """
+        Kept for compatibility with the old per-letter layout, every word now lives in
+        the definitions table so this only makes sure that table exists.
+        """
+        try:
+            self.openDictionary()
+            return (DEFINITIONS_TABLE in self._database.readListOfTables())
+        except Exception as e:
+            print(e)
+            return False 
+
+        finally:
+            self._database.closeDatabase() 
+        return False 
+
+    def addDefinition(self, letter, word, defintion):
+        """Adds a new definition into the selected dictionary (replacing the word's old one)."""
+        try:
+            self.openDictionary()
+            key = wordKey(word)
+            with self.writing() as databases:
+                for database in databases:
+                    row_id = self.definitionID(word, database)
+                    if row_id is not None:
+                        database.updateValue(DEFINITIONS_TABLE, "DEFINITION", defintion, "WORD_KEY", key)
+                        if self.hasFullTextIndex(database):
+                            database.updateValue(FULL_TEXT_TABLE, "DEFINITION", defintion, "rowid", row_id)
+                    else:
+                        database.insertRow(DEFINITIONS_TABLE, ["WORD", "WORD_KEY", "DEFINITION"], [word, key, defintion])
+                        row_id = self.definitionID(word, database)
+                        if row_id is not None and self.hasFullTextIndex(database):
+                            database.insertRow(FULL_TEXT_TABLE, ["rowid"]+FULL_TEXT_FIELDS, [row_id, word, defintion])
+        except Exception as e:
+            print("Failed to add defintion to dictionary:",e)
+        finally:
+            self._database.closeDatabase() 
+
+    def updateDefinition(self, letter, word, definition):
+        """Updates the current selected definition word.""" 
+        try:
+            self.openDictionary()
+            with self.writing() as databases:
+                for database in databases:
+                    database.updateValue(DEFINITIONS_TABLE, "DEFINITION", definition, "WORD_KEY", wordKey(word))
+                    row_id = self.definitionID(word, database)
+                    if row_id is not None and self.hasFullTextIndex(database):
+                        database.updateValue(FULL_TEXT_TABLE, "DEFINITION", definition, "rowid", row_id)
+            return True
+
+        except Exception as e:
+            print("Failed to update defintion in dictionary:",e)
+            return False 
+        finally:
+            self._database.closeDatabase() 
+        return False 
+
+    def removeDefinition(self, letter, word):
+        """Removes the selected word from the dictionary database."""
+        try:
+            self.openDictionary()
+            with self.writing() as databases:
+                for database in databases:
+                    # The definition and its full-text row go together, by the ID the word key lookup found.
+                    row_id = self.definitionID(word, database)
+                    index_table = FULL_TEXT_TABLE if self.hasFullTextIndex(database) else ""
+                    database.removeIndexedRow(DEFINITIONS_TABLE, row_id, index_table)
+        except Exception as e:
+            print("Failed to remove defintion from dictionary:",e)
+        finally:
+            self._database.closeDatabase() 
+
+    def getDefinitionSources(self, word):
+        """
+        Returns the (definition, dictionary name) pairs of a word, with one query
+        across every dictionary of the union (or the selected dictionary only).
+        """
+        sources = []
+        try:
+            self.openDictionary()
+            sources = list(self._database.iterUnion(self.unionSources(), DEFINITIONS_TABLE, ["DEFINITION"], "WORD_KEY", wordKey(word)))
+        except Exception as e:
+            print("Failed to read the definitions:", e)
+        finally:
+            self._database.closeDatabase()
+        return sources
+
+    def getDefinition(self, letter, word):
+        """
+        Returns the word selected definition from the dictionary as a string. In union
+        mode the definitions of every dictionary are returned, each under its dictionary name.
+        """
+        try:
+            definition = None 
+            if self.isUnion():
+                sources = self.getDefinitionSources(word)
+                if len(sources) == 1:
+                    return "{df} <i>({sr})</i>".format(df=sources[0][0], sr=sources[0][1])
+                return "".join("<br><i>{sr}:</i> {df}".format(df=definition, sr=source) for definition, source in sources)
+            self.openDictionary()
+            with self.reading() as reader:
+                definition = reader.getCondValuesFromField(DEFINITIONS_TABLE, "DEFINITION", "WORD_KEY", wordKey(word))
+            if definition:
+                definition = definition[0]
+            return definition
+        except Exception as e:
+            print(e)
+        finally:
+            self._database.closeDatabase() 
+
+    def searchDefinitions(self, text, limit=50):
+        """
+        Full-text search of the words and definitions of the selected dictionary. Returns up
+        to limit (word, snippet) pairs, best match first; the matched terms of the snippet are
+        wrapped in SNIPPET_START and SNIPPET_END.
+        """
+        hits = []
+        query = fullTextQuery(text)
+        if not query:
+            return hits
+        try:
+            self.openDictionary()
+            with self.reading() as reader:
+                hits = [(word, snippet) for word, snippet in reader.fullTextSearch(FULL_TEXT_TABLE, ["WORD"], query, limit)]
+        except Exception as e:
+            print("Failed to search the dictionary:", e)
+        finally:
+            self._database.closeDatabase()
+        return hits
+
+    def insertNewTableLetter(self, letter):
+        """
+        Kept for compatibility with the old per-letter layout, there are no letter
+        tables anymore so this only makes sure the definitions table exists.
+        """
+        try:
+            if len(letter) == 1:
+                self.openDictionary()
+                self._database.createTable(DEFINITIONS_TABLE, DEFINITIONS_SCHEMA)
+            else:
+                print("Incorrect input, must be a letter for new table entry.")
+
+        
+        except Exception as e:
+            print("Failed to insert a new table letter:", e)
+        
+        finally:
+            if self._database._connection:
+                self._database.closeDatabase()
+
+def migrateAllDatabases():
+    """Migrates every dictionary in the dictionary folder to the single table layout."""
+    database = DefinitionsDatabase()
+    for database_name in sorted(database.getDatabaseNames() or []):
+        database.setNewDatabase(database_name)
+        database.checkIfLetterExists("")
+
+if __name__ == "__main__":
+    migrateAllDatabases()
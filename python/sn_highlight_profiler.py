@@ -0,0 +1,129 @@
+from bisect import bisect_left
+from time import perf_counter
+import heapq
+
+# Upper bounds (ms) of the histogram buckets, the last bucket holds everything slower.
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+
+# Slowest blocks kept, and the pause (seconds) between two blocks that ends a rehighlight pass.
+WORST_BLOCKS = 10
+PASS_GAP_SECONDS = 0.005
+
+class Histogram:
+    """Count, total, max and bucketed distribution of durations (in seconds)."""
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000)] += 1
+
+    def copy(self):
+        histogram = Histogram()
+        histogram.count, histogram.total, histogram.max = self.count, self.total, self.max
+        histogram.buckets = list(self.buckets)
+        return histogram
+
+    def format(self):
+        """Returns e.g. "120x, 35.2ms total, max 4.1ms | <0.1ms 80, <0.25ms 30, <5ms 10"."""
+        buckets = []
+        for index, count in enumerate(self.buckets):
+            if count:
+                bound = "<{b}ms".format(b=HISTOGRAM_BOUNDS_MS[index]) if index < len(HISTOGRAM_BOUNDS_MS) else ">{b}ms".format(b=HISTOGRAM_BOUNDS_MS[-1])
+                buckets.append("{bd} {ct}".format(bd=bound, ct=count))
+        return "{ct}x, {tt:.1f}ms total, max {mx:.2f}ms | {bk}".format(
+            ct=self.count, tt=self.total * 1000, mx=self.max * 1000, bk=", ".join(buckets))
+
+class BlockTimer:
+    """Times the phases of one highlightBlock call, see HighlightProfiler.blockTimer."""
+    __slots__ = ("profiler", "highlighter", "start", "last", "phases")
+
+    def __init__(self, profiler, highlighter):
+        self.profiler = profiler
+        self.highlighter = highlighter
+        self.start = self.last = perf_counter()
+        self.phases = []
+
+    def lap(self, phase):
+        """Ends a phase: the time since the previous lap (or the start) is charged to it."""
+        now = perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def finish(self, block):
+        self.profiler.recordBlock(self, block, perf_counter())
+
+class HighlightProfiler:
+    """
+    Optional instrumentation of the syntax highlighters: the time of every phase of every
+    highlighted block, the blocks and the rehighlight passes (blocks highlighted back to back)
+    go into histograms, and the slowest blocks are kept with their position in the document.
+    Switched off it costs one attribute check per block (blockTimer returns None).
+    """
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def setEnabled(self, enabled):
+        self.enabled = enabled
+
+    def reset(self):
+        self._phases = {}
+        self._blocks = Histogram()
+        self._passes = Histogram()
+        self._worst = []
+        self._pass_start = None
+        self._pass_end = None
+
+    def blockTimer(self, highlighter):
+        """Returns a BlockTimer for a block about to be highlighted, or None while switched off."""
+        if not self.enabled:
+            return None
+        return BlockTimer(self, highlighter)
+
+    def recordBlock(self, timer, block, end):
+        seconds = end - timer.start
+        for phase, phase_seconds in timer.phases:
+            key = (timer.highlighter, phase)
+            if key not in self._phases:
+                self._phases[key] = Histogram()
+            self._phases[key].add(phase_seconds)
+        self._blocks.add(seconds)
+        if self._pass_end is not None and timer.start - self._pass_end > PASS_GAP_SECONDS:
+            self._passes.add(self._pass_end - self._pass_start)
+            self._pass_start = None
+        if self._pass_start is None:
+            self._pass_start = timer.start
+        self._pass_end = end
+        entry = (seconds, timer.highlighter, block.blockNumber(), block.position(), block.length(), timer.phases)
+        if len(self._worst) < WORST_BLOCKS:
+            heapq.heappush(self._worst, entry)
+        elif seconds > self._worst[0][0]:
+            heapq.heapreplace(self._worst, entry)
+
+    def report(self):
+        """Returns the profile as lines of text."""
+        passes = self._passes.copy()
+        if self._pass_start is not None:
+            # The pass in progress
+            passes.add(self._pass_end - self._pass_start)
+        lines = ["Highlighting profile ({st})".format(st="on" if self.enabled else "off"),
+                 "  blocks: " + self._blocks.format(),
+                 "  rehighlight passes: " + passes.format()]
+        for (highlighter, phase), histogram in sorted(self._phases.items()):
+            lines.append("  {hl} {ph}: {hs}".format(hl=highlighter, ph=phase, hs=histogram.format()))
+        if self._worst:
+            lines.append("  slowest blocks:")
+        for seconds, highlighter, number, position, length, phases in sorted(self._worst, reverse=True):
+            lines.append("    {ms:.2f}ms {hl} block {nb} (offset {ps}, {ln} chars): {ph}".format(
+                ms=seconds * 1000, hl=highlighter, nb=number, ps=position, ln=length,
+                ph=", ".join("{p} {ms:.2f}ms".format(p=phase, ms=phase_seconds * 1000) for phase, phase_seconds in phases)))
+        return lines
+
+# Shared by every highlighter.
+HIGHLIGHT_PROFILER = HighlightProfiler()
@@ -0,0 +1,100 @@
+from enum import Enum
+import re
+
+class States(Enum):
+    """Lexer state at the end of a line, kept as the block state so tags, quotes and comments can span lines."""
+    NONE = 0
+    TAG = 1
+    COMMENT = 2
+    QUOTE = 3
+    SINGLE_QUOTE = 4
+
+# Kinds of the spans lexHtml returns.
+EDGE = "edge"
+TAG_NAME = "tag name"
+INSIDE = "inside"
+ATTRIBUTE = "attribute"
+QUOTE = "quote"
+COMMENT = "comment"
+
+# Tag names highlighted as keywords.
+HTML_TAGS = frozenset((
+    "!doctype", "a", "abbr", "acronym", "address", "applet", "area", "article", "aside", "audio", "b", "base",
+    "basefont", "bdi", "bdo", "big", "blockquote", "body", "br", "button", "canvas", "caption", "center", "cite",
+    "code", "col", "colgroup", "command", "datalist", "dd", "del", "details", "dfn", "dir", "div", "dl", "dt", "em",
+    "embed", "fieldset", "figcaption", "figure", "font", "footer", "form", "frame", "frameset", "h1", "h2", "h3",
+    "h4", "h5", "h6", "head", "header", "hgroup", "hr", "html", "i", "iframe", "img", "input", "ins", "kbd",
+    "keygen", "label", "legend", "li", "link", "map", "mark", "menu", "meta", "meter", "nav", "noframes",
+    "noscript", "object", "ol", "optgroup", "option", "output", "p", "param", "pre", "progress", "q", "rp", "rt",
+    "ruby", "s", "samp", "script", "section", "select", "small", "source", "span", "strike", "strong", "style",
+    "sub", "summary", "sup", "table", "tbody", "td", "textarea", "tfoot", "th", "thead", "time", "title", "tr",
+    "track", "tt", "u", "ul", "var", "video", "wbr"))
+
+# A tag name right after "<" or "</", and the next token inside a tag.
+NAME_PATTERN = re.compile(r"!?[A-Za-z][A-Za-z0-9-]*")
+TAG_TOKEN_PATTERN = re.compile(r"""(\s+)|(/?>)|(")|(')|(=)|([^\s"'>/=]+)|(/)""")
+
+def lexHtml(text, state=States.NONE, tags=HTML_TAGS):
+    """
+    Splits one line of HTML into (start, length, kind) spans in a single left to right pass,
+    starting in state (where the previous line ended). Tag names are looked up in the tags set,
+    so the cost does not depend on how many there are. Returns the spans and the end state.
+    """
+    spans = []
+    index = 0
+    length = len(text)
+    while index < length:
+        if state is States.NONE:
+            index = text.find("<", index)
+            if index == -1:
+                break
+            if text.startswith("<!--", index):
+                state = States.COMMENT
+                continue
+            edge = 2 if text.startswith("</", index) else 1
+            spans.append((index, edge, EDGE))
+            index += edge
+            name = NAME_PATTERN.match(text, index)
+            if name is not None:
+                spans.append((index, name.end() - index, TAG_NAME if name.group().lower() in tags else INSIDE))
+                index = name.end()
+            state = States.TAG
+        elif state is States.COMMENT:
+            end = text.find("-->", index)
+            if end == -1:
+                spans.append((index, length - index, COMMENT))
+                break
+            spans.append((index, end + 3 - index, COMMENT))
+            index = end + 3
+            state = States.NONE
+        elif state is States.QUOTE or state is States.SINGLE_QUOTE:
+            # A quoted value continued from the previous line
+            end = text.find('"' if state is States.QUOTE else "'", index)
+            if end == -1:
+                spans.append((index, length - index, QUOTE))
+                break
+            spans.append((index, end + 1 - index, QUOTE))
+            index = end + 1
+            state = States.TAG
+        else:
+            token = TAG_TOKEN_PATTERN.match(text, index)
+            whitespace, close, double_quote, single_quote, equals, attribute, slash = token.groups()
+            if close is not None:
+                spans.append((index, len(close), EDGE))
+                state = States.NONE
+            elif double_quote is not None or single_quote is not None:
+                quote = double_quote or single_quote
+                end = text.find(quote, index + 1)
+                if end == -1:
+                    spans.append((index, length - index, QUOTE))
+                    state = States.QUOTE if quote == '"' else States.SINGLE_QUOTE
+                    break
+                spans.append((index, end + 1 - index, QUOTE))
+                index = end + 1
+                continue
+            elif attribute is not None:
+                spans.append((index, len(attribute), ATTRIBUTE))
+            elif equals is not None or slash is not None:
+                spans.append((index, 1, INSIDE))
+            index = token.end()
+    return spans, state
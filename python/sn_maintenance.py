@@ -0,0 +1,149 @@
+from PySide2.QtCore import (QObject, QEvent, QTimer)
+from PySide2.QtWidgets import QApplication
+from sn_dict_database import listDatabaseNames
+from time import monotonic
+
+# How often the scheduler looks for idle time, and how long the user must have been idle.
+CHECK_INTERVAL_MS = 30000
+IDLE_SECONDS = 60
+
+# Rows changed since the last maintenance before the statistics are gathered again with ANALYZE,
+# below it (but above zero) the cheaper PRAGMA optimize is used.
+ANALYZE_CHURN = 500
+
+# Share of free pages (left behind by deletes) and minimum number of them before a VACUUM.
+VACUUM_FREE_RATIO = 0.2
+VACUUM_MIN_FREE_PAGES = 64
+
+# User input that counts as activity.
+ACTIVITY_EVENTS = (QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.Wheel)
+
+def formatSize(size):
+    """Returns a byte count as a readable size, e.g. "1.5 MiB"."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return "{sz:.1f} {un}".format(sz=size, un=unit)
+        size /= 1024
+    return "{sz:.1f} GiB".format(sz=size)
+
+class DictionaryMaintenance(QObject):
+    """
+    Keeps the dictionaries in shape while the user is idle: integrity_check once per session,
+    VACUUM when deletes left enough free pages behind, and ANALYZE or PRAGMA optimize when rows
+    changed. Every task runs on the DatabaseWorker thread, one task per idle check so queued
+    dictionary requests never wait behind more than one of them. The work is logged to the terminal.
+    """
+    def __init__(self, database_worker, database_path, terminal, parent=None):
+        super().__init__(parent)
+        self._database_worker = database_worker
+        self._database_path = database_path
+        self._terminal = terminal
+        self._last_activity = monotonic()
+        self._running = False
+        self._checked = set()
+        # (dictionary name, tasks) to look at, tasks is None until its status was read.
+        self._queue = []
+
+        QApplication.instance().installEventFilter(self)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.checkIdle)
+        self._timer.start(CHECK_INTERVAL_MS)
+
+    def eventFilter(self, watched, event):
+        if event.type() in ACTIVITY_EVENTS:
+            self._last_activity = monotonic()
+        return False
+
+    def isIdle(self):
+        """Returns true if the user has not touched the keyboard or mouse for IDLE_SECONDS."""
+        return monotonic() - self._last_activity >= IDLE_SECONDS
+
+    def checkIdle(self):
+        if self.isIdle():
+            self.runNext()
+
+    def runNow(self):
+        """Starts a maintenance pass right away, idle or not (tasks left unfinished go first)."""
+        self._queue = [entry for entry in self._queue if entry[1]]
+        self.runNext(force=True)
+
+    def runNext(self, force=False):
+        """Runs the next due task, refilling the queue of dictionaries to look at when it is empty."""
+        if self._running:
+            return
+        if not self._queue:
+            self._queue = [(database_name, None) for database_name in sorted(listDatabaseNames(self._database_path))]
+        if not self._queue:
+            return
+        self._running = True
+        database_name, tasks = self._queue.pop(0)
+        if tasks:
+            self.runTasks(database_name, tasks, force)
+            return
+        self._database_worker.submit("maintenanceStatus", database_name,
+            callback=self._planMaintenance(force), channel="maintenance")
+
+    def dueTasks(self, status):
+        """Returns the maintenance tasks a dictionary needs given its maintenance status."""
+        tasks = []
+        if status["database"] not in self._checked:
+            tasks.append("integrity_check")
+        page_count = status.get("page_count", 0)
+        free_pages = status.get("freelist_count", 0)
+        if free_pages >= VACUUM_MIN_FREE_PAGES and page_count and free_pages / page_count >= VACUUM_FREE_RATIO:
+            tasks.append("vacuum")
+        churn = status.get("churn", 0)
+        if churn >= ANALYZE_CHURN or not status.get("analyzed", True):
+            tasks.append("analyze")
+        elif churn > 0:
+            tasks.append("optimize")
+        return tasks
+
+    def _planMaintenance(self, force):
+        def planMaintenance(status):
+            tasks = self.dueTasks(status)
+            if not tasks:
+                self._running = False
+                # A forced pass goes through every dictionary in one go.
+                if force and self._queue:
+                    self.runNext(force)
+                return
+            self.runTasks(status["database"], tasks, force)
+        return planMaintenance
+
+    def runTasks(self, database_name, tasks, force):
+        """Runs the tasks of a dictionary one after the other on the worker thread."""
+        def reportMaintenance(report):
+            self.report(report)
+            if report["task"] == "integrity_check":
+                self._checked.add(database_name)
+            if tasks[1:]:
+                if force or self.isIdle():
+                    self.runTasks(database_name, tasks[1:], force)
+                    return
+                # The user is back, the rest waits for the next idle time.
+                self._queue.insert(0, (database_name, tasks[1:]))
+            self._running = False
+            if force and self._queue:
+                self.runNext(force)
+        self._database_worker.submit("runMaintenance", database_name, tasks[0],
+            callback=reportMaintenance, channel="maintenance")
+
+    def report(self, report):
+        """Logs a maintenance report to the terminal."""
+        result = report.get("result")
+        if "error" in report:
+            result = "failed ({err})".format(err=report["error"])
+        elif report["task"] == "integrity_check":
+            result = "ok" if result == ["ok"] else "; ".join(result or ["failed"])
+        else:
+            result = "done" if result is True else "failed"
+        sizes = ""
+        if "size_after" in report:
+            sizes = ", {bf} -> {af}".format(bf=formatSize(report["size_before"]), af=formatSize(report["size_after"]))
+        self._terminal("Dictionary maintenance, {db} {tk}: {rs} in {sec:.2f}s{sz}".format(
+            db=report["database"], tk=report["task"], rs=result, sec=report["seconds"], sz=sizes))
+
+    def stop(self):
+        self._timer.stop()
+        self._database_worker.cancel("maintenance")
@@ -0,0 +1,214 @@
+from sn_dict_database import wordKey
+from collections import Counter
+import re
+
+# Word characters, how the highlighter's tokens are split when counting the terms the document uses.
+WORD_PATTERN = re.compile(r"\w+")
+
+class TrieNode:
+    """A node of the PrefixIndex, count is the number of words at or below it."""
+    __slots__ = ("children", "word", "count")
+
+    def __init__(self):
+        self.children = {}
+        self.word = None
+        self.count = 0
+
+class PrefixIndex:
+    """
+    Trie of the dictionary words keyed by their case-folded spelling (the same WORD_KEY the
+    database uses). Exact, case-insensitive and prefix lookups cost O(k) in the length of the
+    word, instead of scanning the whole word list. It is filled once per dictionary load and
+    then kept up to date with add and remove.
+    """
+    def __init__(self, words=()):
+        self._root = TrieNode()
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return self._root.count
+
+    def __contains__(self, word):
+        return self.contains(word)
+
+    def __iter__(self):
+        return self.words()
+
+    def clear(self):
+        self._root = TrieNode()
+
+    def _node(self, key):
+        node = self._root
+        for character in key:
+            node = node.children.get(character)
+            if node is None:
+                return None
+        return node
+
+    def add(self, word):
+        """Adds a word, returns false if a word with the same case-folded spelling is already in."""
+        key = wordKey(word)
+        if not key or self.find(word) is not None:
+            return False
+        node = self._root
+        node.count += 1
+        for character in key:
+            child = node.children.get(character)
+            if child is None:
+                child = node.children[character] = TrieNode()
+            child.count += 1
+            node = child
+        node.word = word
+        return True
+
+    def addAll(self, words):
+        for word in words:
+            self.add(word)
+
+    def remove(self, word):
+        """Removes a word (matched case-insensitively), returns false if it was not in."""
+        key = wordKey(word)
+        if not key or self.find(word) is None:
+            return False
+        node = self._root
+        node.count -= 1
+        for character in key:
+            child = node.children[character]
+            child.count -= 1
+            if not child.count:
+                # Nothing else below, drop the whole branch.
+                del node.children[character]
+                return True
+            node = child
+        node.word = None
+        return True
+
+    def contains(self, word):
+        """Returns true if the word is in with exactly this spelling."""
+        return self.find(word) == word
+
+    def find(self, word):
+        """Case-insensitive lookup, returns the word as spelled in the dictionary or None."""
+        node = self._node(wordKey(word))
+        return node.word if node is not None else None
+
+    def _walk(self, node):
+        # Children in key order, so the words come out in WORD_KEY (dictionary) order.
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.word is not None:
+                yield node.word
+            stack.extend(node.children[character] for character in sorted(node.children, reverse=True))
+
+    def startsWith(self, prefix, limit=None):
+        """Returns the words starting with prefix (case-insensitive) in dictionary order, at most limit of them."""
+        node = self._node(wordKey(prefix))
+        if node is None:
+            return []
+        words = []
+        for word in self._walk(node):
+            if limit is not None and len(words) >= limit:
+                break
+            words.append(word)
+        return words
+
+    def countPrefix(self, prefix):
+        """Returns the number of words starting with prefix."""
+        node = self._node(wordKey(prefix))
+        return node.count if node is not None else 0
+
+    def rank(self, word):
+        """Returns the number of words ordered before the word, i.e. its row in the sorted word list."""
+        node = self._root
+        rank = 0
+        for character in wordKey(word):
+            if node.word is not None:
+                rank += 1
+            rank += sum(child.count for other, child in node.children.items() if other < character)
+            node = node.children.get(character)
+            if node is None:
+                break
+        return rank
+
+    def complete(self, prefix, frequencies=None, limit=10):
+        """
+        Returns up to limit completions of prefix: the words the document uses most often first
+        (frequencies maps case-folded words to their count, see TermCounts), then the
+        others in dictionary order. Only the prefix's candidates are ranked: the prefix's branch
+        of the trie is looked up in frequencies, or the other way round if frequencies is smaller.
+        """
+        key = wordKey(prefix)
+        node = self._node(key)
+        if node is None:
+            return []
+        used = []
+        if frequencies and node.count <= len(frequencies):
+            # Ranked below, so the branch is walked in any order.
+            stack = [(node, key)]
+            while stack:
+                branch, term = stack.pop()
+                if branch.word is not None and term in frequencies:
+                    used.append((-frequencies[term], term, branch.word))
+                stack.extend((child, term + character) for character, child in branch.children.items())
+        elif frequencies:
+            for term, count in frequencies.items():
+                if term.startswith(key):
+                    word = self.find(term)
+                    if word is not None:
+                        used.append((-count, term, word))
+        completions = [word for _, _, word in sorted(used)[:limit]]
+        if len(completions) < limit:
+            taken = set(completions)
+            for word in self._walk(node):
+                if word not in taken:
+                    completions.append(word)
+                    if len(completions) >= limit:
+                        break
+        return completions
+
+    def words(self):
+        """Iterates over every word in dictionary order."""
+        return self._walk(self._root)
+
+class TermCounts:
+    """
+    How often the document uses each word, keyed by the case-folded word and kept per block
+    from the highlighter's tokens, so an edit only recounts the blocks highlighted again.
+    frequencies is what PrefixIndex.complete ranks by, it never holds a zero count.
+    """
+    def __init__(self):
+        self._blocks = {}
+        self.frequencies = Counter()
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def clear(self):
+        self._blocks = {}
+        self.frequencies = Counter()
+
+    def update(self, block_id, tokens):
+        """Replaces the counts of a block with those of its (word, position) tokens."""
+        self.discard(block_id)
+        counts = Counter(wordKey(part) for word, _ in tokens for part in WORD_PATTERN.findall(word))
+        if counts:
+            self._blocks[block_id] = counts
+            self.frequencies.update(counts)
+
+    def discard(self, block_id):
+        """Forgets a (deleted) block."""
+        counts = self._blocks.pop(block_id, None)
+        if not counts:
+            return
+        for term, count in counts.items():
+            if self.frequencies[term] > count:
+                self.frequencies[term] -= count
+            else:
+                del self.frequencies[term]
+
+    def retain(self, block_ids):
+        """Forgets every block not in block_ids."""
+        for block_id in [block_id for block_id in self._blocks if block_id not in block_ids]:
+            self.discard(block_id)
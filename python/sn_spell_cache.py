@@ -0,0 +1,77 @@
+from collections import OrderedDict
+import threading
+
+# Words kept per language, prose rarely uses more than a few thousand distinct words.
+SPELL_CACHE_SIZE = 20000
+
+class SpellCheckCache:
+    """
+    Bounded LRU cache of enchant check results, one per language tag, shared by every
+    EnchantHighlighter (SPELL_CACHE) so a word is checked once whatever notepad it is typed in.
+    Invalidate a language when its word list changes (personal word added, language reloaded).
+    """
+    def __init__(self, max_size=SPELL_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._results = {}
+        # Bumped by invalidate, a check started before it does not store its result.
+        self._generations = {}
+        self._hits = 0
+        self._misses = 0
+
+    def check(self, sp_dict, word):
+        """Returns sp_dict.check(word), from the cache when the word was checked before."""
+        tag = sp_dict.tag
+        with self._lock:
+            results = self._results.get(tag)
+            correct = results.get(word) if results is not None else None
+            if correct is not None:
+                results.move_to_end(word)
+                self._hits += 1
+                return correct
+            self._misses += 1
+            generation = self._generations.setdefault(tag, 0)
+        correct = bool(sp_dict.check(word))
+        with self._lock:
+            # Checked against the word list invalidate replaced
+            if self._generations[tag] != generation:
+                return correct
+            results = self._results.get(tag)
+            if results is None:
+                results = self._results[tag] = OrderedDict()
+            results[word] = correct
+            if len(results) > self._max_size:
+                results.popitem(last=False)
+        return correct
+
+    def cached(self, tag, word):
+        """Returns the cached result of a word (a hit), or None if it was not checked yet."""
+        with self._lock:
+            results = self._results.get(tag)
+            correct = results.get(word) if results is not None else None
+            if correct is not None:
+                results.move_to_end(word)
+                self._hits += 1
+            return correct
+
+    def invalidate(self, tag=None):
+        """Drops the results of a language, or of every language if tag is None."""
+        with self._lock:
+            if tag is None:
+                self._results.clear()
+                for known_tag in self._generations:
+                    self._generations[known_tag] += 1
+            else:
+                self._results.pop(tag, None)
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    def stats(self):
+        """Returns the hits, misses, hit rate and cached words (per language)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {"hits": self._hits, "misses": self._misses,
+                    "hit_rate": self._hits / lookups if lookups else 0.0,
+                    "sizes": {tag: len(results) for tag, results in self._results.items()}}
+
+# Shared by every EnchantHighlighter.
+SPELL_CACHE = SpellCheckCache()
@@ -0,0 +1,80 @@
+from PySide2.QtCore import (QObject, Signal)
+from concurrent.futures import ThreadPoolExecutor
+from sn_spell_cache import SPELL_CACHE
+import enchant
+import threading
+
+class SpellCheckWorker(QObject):
+    """
+    Runs the enchant checks the highlighters could not answer from SPELL_CACHE on a background
+    thread, so typing never waits for enchant whatever the language. Every request carries the
+    revision of its block: only the latest request of a block is checked and delivered, and
+    the highlighter drops results for a block that changed again on the way.
+    The thread has its own enchant dictionaries, the highlighters' ones are only used on the GUI thread.
+    """
+    # (block key, revision, callback, misspellings) emitted from the worker thread.
+    _result = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spelling")
+        self._lock = threading.Lock()
+        self._latest_revisions = {}
+        self._dictionaries = {}
+        self._reload = False
+        # Queued to the GUI thread, since that is where this object lives.
+        self._result.connect(self._deliver)
+
+    def isCurrent(self, key, revision):
+        """Returns true if the revision is still the latest one requested for the block."""
+        with self._lock:
+            return self._latest_revisions.get(key) == revision
+
+    def check(self, key, revision, tag, tokens, callback):
+        """
+        Queues the check of a block's (word, position) tokens in language tag. key identifies
+        the block (highlighter and block id); callback(revision, misspellings) is called on the
+        GUI thread with the (start, end) spans of the misspelled words.
+        """
+        with self._lock:
+            self._latest_revisions[key] = revision
+        self._executor.submit(self._run, key, revision, tag, tokens, callback)
+
+    def reloadDictionaries(self):
+        """Makes the thread load its dictionaries again (e.g. a word was added to the personal list)."""
+        with self._lock:
+            self._reload = True
+
+    def _dictionary(self, tag):
+        with self._lock:
+            if self._reload:
+                self._dictionaries = {}
+                self._reload = False
+        if tag not in self._dictionaries:
+            self._dictionaries[tag] = enchant.Dict(tag)
+        return self._dictionaries[tag]
+
+    def _run(self, key, revision, tag, tokens, callback):
+        if not self.isCurrent(key, revision):
+            return
+        try:
+            sp_dict = self._dictionary(tag)
+            misspellings = [(pos, pos + len(word)) for word, pos in tokens if not SPELL_CACHE.check(sp_dict, word)]
+        except Exception as e:
+            print("Background spell check failed: {err}".format(err=e))
+            return
+        self._result.emit((key, revision, callback, misspellings))
+
+    def _deliver(self, message):
+        key, revision, callback, misspellings = message
+        with self._lock:
+            if self._latest_revisions.get(key) != revision:
+                return
+            del self._latest_revisions[key]
+        callback(revision, misspellings)
+
+    def shutdown(self):
+        """Drops the queued checks and stops the thread once the running one is done."""
+        with self._lock:
+            self._latest_revisions.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
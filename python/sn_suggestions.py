@@ -0,0 +1,115 @@
+from PySide2.QtCore import (QObject, Signal)
+from collections import (OrderedDict, deque)
+import enchant
+import threading
+
+# Words whose suggestions are kept, and suggestions kept per word (the context menu shows 20).
+SUGGESTION_CACHE_SIZE = 2000
+SUGGESTION_LIMIT = 20
+
+# Misspellings waiting for their suggestions, the oldest are dropped past this.
+MAX_PENDING = 500
+
+class SuggestionWorker(QObject):
+    """
+    Computes enchant spelling suggestions on a background thread as the highlighter finds
+    misspellings, and keeps them in an LRU cache per (language, word) so the context menu can
+    show them right away. The latest request is served first, so a word right-clicked while
+    a long document is being checked does not wait behind the others. The thread has its own
+    enchant dictionaries, the highlighters' ones are only used on the GUI thread.
+    """
+    # (language tag, word, suggestions) emitted from the worker thread, delivered on the GUI thread.
+    suggestionsReady = Signal(str, str, object)
+
+    def __init__(self, parent=None, max_size=SUGGESTION_CACHE_SIZE):
+        super().__init__(parent)
+        self._max_size = max_size
+        self._condition = threading.Condition()
+        self._cache = OrderedDict()
+        self._queue = deque()
+        self._pending = set()
+        self._running = True
+        # Bumped by invalidate, the thread then reloads its dictionaries (word lists changed).
+        self._generation = 0
+        # The word being computed and the generation it was started in.
+        self._computing = None
+        self._thread = threading.Thread(target=self._run, name="suggestions", daemon=True)
+        self._thread.start()
+
+    def suggestions(self, tag, word):
+        """Returns the cached suggestions of a word, or None if they were not computed yet."""
+        with self._condition:
+            suggestions = self._cache.get((tag, word))
+            if suggestions is not None:
+                self._cache.move_to_end((tag, word))
+            return suggestions
+
+    def request(self, tag, word):
+        """Queues the suggestions of a word unless they are cached or already queued."""
+        key = (tag, word)
+        with self._condition:
+            if key in self._cache:
+                return
+            if key in self._pending:
+                if key not in self._queue:
+                    if self._computing == (key, self._generation):
+                        # Being computed right now.
+                        return
+                    # Being computed with the word lists of before invalidate, its result is dropped.
+                else:
+                    # Move it to the front, it is wanted again.
+                    self._queue.remove(key)
+            self._pending.add(key)
+            self._queue.append(key)
+            if len(self._queue) > MAX_PENDING:
+                self._pending.discard(self._queue.popleft())
+            self._condition.notify()
+
+    def invalidate(self, tag=None):
+        """Drops the cached suggestions of a language, or of every language if tag is None."""
+        with self._condition:
+            for key in [key for key in self._cache if tag is None or key[0] == tag]:
+                del self._cache[key]
+            self._generation += 1
+
+    def _run(self):
+        dictionaries = {}
+        generation = 0
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                tag, word = self._queue.pop()
+                if generation != self._generation:
+                    dictionaries = {}
+                    generation = self._generation
+                self._computing = ((tag, word), generation)
+            try:
+                if tag not in dictionaries:
+                    dictionaries[tag] = enchant.Dict(tag)
+                suggestions = dictionaries[tag].suggest(word)[:SUGGESTION_LIMIT]
+            except Exception as e:
+                print("Failed to compute the spelling suggestions of {wd}: {err}".format(wd=word, err=e))
+                suggestions = []
+            with self._condition:
+                self._computing = None
+                if (tag, word) not in self._queue:
+                    self._pending.discard((tag, word))
+                if generation != self._generation:
+                    # Invalidated while it was computed, it would bring stale suggestions back.
+                    continue
+                self._cache[(tag, word)] = suggestions
+                if len(self._cache) > self._max_size:
+                    self._cache.popitem(last=False)
+            self.suggestionsReady.emit(tag, word, suggestions)
+
+    def shutdown(self):
+        """Drops the queued words and stops the thread once the running one is done."""
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._pending.clear()
+            self._condition.notify()
+        self._thread.join()
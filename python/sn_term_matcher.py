@@ -0,0 +1,278 @@
+from collections import deque
+import re
+
+# Word tokens of a block, the units looked up in the single-word term set.
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def foldCharacter(character):
+    """Case-folds one character, keeping it one character long so text offsets stay valid."""
+    folded = character.casefold()
+    if len(folded) == 1:
+        return folded
+    folded = character.lower()
+    return folded if len(folded) == 1 else character
+
+def foldText(text):
+    """Case-folds text character by character, the result has the same length as text."""
+    return "".join(map(foldCharacter, text))
+
+def isWordCharacter(character):
+    return character.isalnum() or character == "_"
+
+def termKeys(term):
+    """Returns the case-folded words of a term, e.g. {"thing", "in", "itself"}."""
+    return {foldText(match.group()) for match in TOKEN_PATTERN.finditer(term)}
+
+def tokenKeys(tokens):
+    """Returns the case-folded words of (word, position) tokens, tokens holding several words ("Kant's") split up."""
+    keys = set()
+    for word, _ in tokens:
+        keys.add(foldText(word))
+        if not word.isalnum():
+            keys.update(termKeys(word))
+    return keys
+
+def isPhrase(term):
+    """Returns true for terms that are more than one word token (e.g. "thing in itself", "being-in-the-world")."""
+    return not all(isWordCharacter(character) for character in term)
+
+class TermMatcher:
+    """
+    Aho-Corasick automaton over the case-folded dictionary terms. One linear pass over a
+    block finds every single-word and multi-word term in it, whatever the number of terms,
+    matching whole words only. Add the terms then build() before matching (the constructor
+    does both).
+    """
+    def __init__(self, terms=()):
+        # Per state: transitions, failure link, term ending here, depth and the nearest
+        # state on the failure chain where a term ends ("dictionary suffix link").
+        self._goto = [{}]
+        self._fail = [0]
+        self._term = [None]
+        self._depth = [0]
+        self._output_link = [0]
+        self._term_count = 0
+        for term in terms:
+            self.add(term)
+        self.build()
+
+    def __len__(self):
+        return self._term_count
+
+    def add(self, term):
+        """Adds a term (matched case-insensitively), returns false if it was already in."""
+        key = foldText(term.strip())
+        if not key:
+            return False
+        state = 0
+        for character in key:
+            next_state = self._goto[state].get(character)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][character] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._term.append(None)
+                self._depth.append(self._depth[state] + 1)
+                self._output_link.append(0)
+            state = next_state
+        if self._term[state] is not None:
+            return False
+        self._term[state] = term.strip()
+        self._term_count += 1
+        return True
+
+    def build(self):
+        """Computes the failure and output links (breadth first), needed after adding terms."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            self._output_link[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and character not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(character, 0)
+                self._fail[next_state] = fail
+                self._output_link[next_state] = fail if self._term[fail] is not None else self._output_link[fail]
+                queue.append(next_state)
+
+    def isWholeWord(self, text, start, end):
+        """Returns true if text[start:end] does not start or end in the middle of a word."""
+        if start > 0 and isWordCharacter(text[start - 1]) and isWordCharacter(text[start]):
+            return False
+        if end < len(text) and isWordCharacter(text[end]) and isWordCharacter(text[end - 1]):
+            return False
+        return True
+
+    def findAll(self, text):
+        """
+        Yields (start, length, term) for every whole-word occurrence of a term in text,
+        overlapping and nested occurrences included (e.g. "thing", "in itself" and
+        "thing in itself" in "thing in itself").
+        """
+        goto = self._goto
+        fail = self._fail
+        state = 0
+        for index, character in enumerate(foldText(text)):
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            match_state = state if self._term[state] is not None else self._output_link[state]
+            while match_state:
+                length = self._depth[match_state]
+                start = index + 1 - length
+                if self.isWholeWord(text, start, index + 1):
+                    yield (start, length, self._term[match_state])
+                match_state = self._output_link[match_state]
+
+    def findLongest(self, text):
+        """Returns the leftmost-longest, non-overlapping term occurrences as (start, length, term)."""
+        matches = sorted(self.findAll(text), key=lambda match: (match[0], -match[1]))
+        longest = []
+        end = 0
+        for start, length, term in matches:
+            if start >= end:
+                longest.append((start, length, term))
+                end = start + length
+        return longest
+
+class DictionaryTerms:
+    """
+    The dictionary terms the highlighter looks for, built once per dictionary change. Single
+    words go into a case-folded hash set that the tokens of a block are looked up in, terms of
+    several words into a TermMatcher. Matching a block costs O(length of the block), however
+    big the dictionary is.
+    """
+    def __init__(self, terms=()):
+        self._words = set()
+        self._phrase_terms = set()
+        self._phrases = TermMatcher()
+        for term in terms:
+            self.add(term)
+        self.build()
+
+    def __len__(self):
+        return len(self._words) + len(self._phrase_terms)
+
+    def add(self, term):
+        """Adds a term (matched case-insensitively), call build() once they are all in."""
+        term = term.strip()
+        if not term:
+            return
+        if isPhrase(term):
+            if foldText(term) not in self._phrase_terms:
+                self._phrase_terms.add(foldText(term))
+                self._phrases.add(term)
+        else:
+            self._words.add(foldText(term))
+
+    def remove(self, term):
+        """Removes a term, call build() afterwards."""
+        term = term.strip()
+        if isPhrase(term):
+            if foldText(term) in self._phrase_terms:
+                self._phrase_terms.discard(foldText(term))
+                # The automaton has no removal, the phrases are few so it is rebuilt.
+                self._phrases = TermMatcher()
+                for phrase in self._phrase_terms:
+                    self._phrases.add(phrase)
+        else:
+            self._words.discard(foldText(term))
+
+    def build(self):
+        self._phrases.build()
+
+    def terms(self):
+        """Returns the case-folded terms."""
+        return self._words | self._phrase_terms
+
+    def changedTerms(self, other):
+        """Returns the (case-folded) terms in only one of self and other."""
+        return self.terms() ^ other.terms()
+
+    def contains(self, word):
+        """Returns true if word (a single token) is a dictionary term, whatever its case."""
+        return foldText(word) in self._words
+
+    def tokens(self, text):
+        """Splits text into its (word, position) tokens."""
+        return [(match.group(), match.start()) for match in TOKEN_PATTERN.finditer(text)]
+
+    def findAll(self, text, tokens=None):
+        """
+        Yields (start, length) for every term occurrence in text. The (word, position) tokens
+        of text can be given if they are already known (e.g. from the spell checker's tokenizer),
+        otherwise text is tokenized here.
+        """
+        if tokens is None:
+            tokens = self.tokens(text)
+        words = self._words
+        for word, position in tokens:
+            if foldText(word) in words:
+                yield (position, len(word))
+            elif not word.isalnum():
+                # Tokens of other tokenizers can hold more than one word ("Kant's").
+                for match in TOKEN_PATTERN.finditer(word):
+                    if foldText(match.group()) in words:
+                        yield (position + match.start(), match.end() - match.start())
+        if len(self._phrases):
+            for start, length, _ in self._phrases.findAll(text):
+                yield (start, length)
+
+class TokenIndex:
+    """
+    Inverted index from the case-folded words of a document to the ids of the blocks holding
+    them, kept up to date by the highlighter as it tokenizes blocks. It tells which blocks have
+    to be rehighlighted when a dictionary term is added or removed.
+    """
+    def __init__(self):
+        self._blocks = {}
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        self._blocks = {}
+        self._keys = {}
+
+    def update(self, block_id, tokens):
+        """Records the (word, position) tokens of a block, replacing what it held before."""
+        keys = tokenKeys(tokens)
+        old_keys = self._keys.get(block_id, set())
+        for key in old_keys - keys:
+            self._discardKey(key, block_id)
+        for key in keys - old_keys:
+            self._blocks.setdefault(key, set()).add(block_id)
+        self._keys[block_id] = keys
+
+    def _discardKey(self, key, block_id):
+        block_ids = self._blocks.get(key)
+        if block_ids is not None:
+            block_ids.discard(block_id)
+            if not block_ids:
+                del self._blocks[key]
+
+    def discard(self, block_id):
+        """Forgets a block (e.g. deleted from the document)."""
+        for key in self._keys.pop(block_id, ()):
+            self._discardKey(key, block_id)
+
+    def retain(self, block_ids):
+        """Forgets every block not in block_ids."""
+        for block_id in [block_id for block_id in self._keys if block_id not in block_ids]:
+            self.discard(block_id)
+
+    def blocksWith(self, term):
+        """Returns the ids of the blocks holding every word of term, the ones it can occur in."""
+        block_ids = None
+        for key in termKeys(term):
+            found = self._blocks.get(key)
+            if not found:
+                return set()
+            block_ids = set(found) if block_ids is None else block_ids & found
+        return block_ids or set()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules live in python/ and import each other by name, the way sn_main runs them.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"))
@@ -0,0 +1,39 @@
+from sn_prefix_index import (PrefixIndex, TermCounts)
+
+# TermCounts
+#---------------------------------------------------------------------------------------------------------
+def tokens(text):
+    return [(word, 0) for word in text.split()]
+
+def test_term_counts_follow_block_updates():
+    counts = TermCounts()
+    counts.update(1, tokens("Geist and geist"))
+    counts.update(2, tokens("GEIST alone"))
+    assert counts.frequencies["geist"] == 3
+    counts.update(1, tokens("Sein"))
+    assert counts.frequencies["geist"] == 1
+    assert counts.frequencies["sein"] == 1
+    assert "and" not in counts.frequencies
+
+def test_term_counts_split_compound_tokens():
+    counts = TermCounts()
+    counts.update(1, [("Kant's", 0)])
+    assert counts.frequencies["kant"] == 1
+
+def test_term_counts_discard_and_retain():
+    counts = TermCounts()
+    for block_id in range(4):
+        counts.update(block_id, tokens("Geist"))
+    counts.discard(0)
+    assert counts.frequencies["geist"] == 3
+    counts.retain({2})
+    assert counts.frequencies == {"geist": 1}
+    assert len(counts) == 1
+    counts.update(2, [])
+    assert not counts.frequencies and not len(counts)
+
+def test_completion_ranked_by_term_counts():
+    index = PrefixIndex(["Geist", "Geistes", "Geister"])
+    counts = TermCounts()
+    counts.update(1, tokens("Geister Geister Geistes"))
+    assert index.complete("geis", counts.frequencies) == ["Geister", "Geistes", "Geist"]
@@ -0,0 +1,136 @@
+from sn_term_matcher import (DictionaryTerms, TermMatcher, TokenIndex)
+
+def matched(text, matches):
+    """Returns the matched text of (start, length, ...) matches, in the order they were found."""
+    return [text[match[0]:match[0] + match[1]] for match in matches]
+
+# TermMatcher
+#---------------------------------------------------------------------------------------------------------
+def test_find_all_overlapping_terms():
+    matcher = TermMatcher(["thing in", "in itself"])
+    text = "the thing in itself"
+    assert sorted(matcher.findAll(text)) == [(4, 8, "thing in"), (10, 9, "in itself")]
+
+def test_find_all_nested_phrases():
+    matcher = TermMatcher(["Geist", "absolute Geist"])
+    text = "the absolute Geist returns"
+    assert sorted(matcher.findAll(text)) == [(4, 14, "absolute Geist"), (13, 5, "Geist")]
+
+def test_find_all_every_nested_term():
+    matcher = TermMatcher(["thing", "in itself", "thing in itself", "itself"])
+    text = "thing in itself"
+    assert sorted(matched(text, matcher.findAll(text))) == ["in itself", "itself", "thing", "thing in itself"]
+
+def test_find_all_repeated_terms():
+    matcher = TermMatcher(["Geist"])
+    text = "Geist, Geist and Geist"
+    assert [start for start, _, _ in matcher.findAll(text)] == [0, 7, 17]
+
+def test_find_longest_prefers_the_longest_leftmost_match():
+    matcher = TermMatcher(["Geist", "absolute Geist", "absolute"])
+    text = "absolute Geist and Geist"
+    assert matcher.findLongest(text) == [(0, 14, "absolute Geist"), (19, 5, "Geist")]
+
+def test_find_longest_drops_overlapping_matches():
+    matcher = TermMatcher(["thing in", "in itself"])
+    assert matcher.findLongest("thing in itself") == [(0, 8, "thing in")]
+
+def test_mid_word_matches_are_rejected():
+    matcher = TermMatcher(["Geist", "sein"])
+    text = "Zeitgeist Geistes Dasein sein"
+    assert matched(text, matcher.findAll(text)) == ["sein"]
+
+def test_matches_next_to_punctuation():
+    matcher = TermMatcher(["Geist", "being-in-the-world"])
+    text = "(Geist), being-in-the-world."
+    assert matched(text, matcher.findAll(text)) == ["Geist", "being-in-the-world"]
+
+def test_matching_is_case_insensitive():
+    matcher = TermMatcher(["absolute Geist", "Straße"])
+    text = "ABSOLUTE GEIST in der strasse, STRASSE, straße"
+    assert matched(text, matcher.findAll(text)) == ["ABSOLUTE GEIST", "straße"]
+
+def test_terms_keep_their_spelling():
+    matcher = TermMatcher(["Absolute Geist"])
+    assert list(matcher.findAll("absolute geist")) == [(0, 14, "Absolute Geist")]
+
+def test_add_ignores_duplicates():
+    matcher = TermMatcher(["Geist"])
+    assert not matcher.add("GEIST")
+    assert not matcher.add("  ")
+    assert len(matcher) == 1
+
+# DictionaryTerms
+#---------------------------------------------------------------------------------------------------------
+def test_dictionary_terms_words_and_phrases():
+    terms = DictionaryTerms(["Geist", "absolute Geist", "Kant"])
+    text = "Kant's absolute geist"
+    assert sorted(matched(text, terms.findAll(text))) == ["Kant", "absolute geist", "geist"]
+
+def test_dictionary_terms_remove():
+    terms = DictionaryTerms(["Geist", "absolute Geist", "thing in itself"])
+    terms.remove("absolute geist")
+    terms.remove("GEIST")
+    terms.build()
+    text = "absolute Geist, thing in itself"
+    assert matched(text, terms.findAll(text)) == ["thing in itself"]
+    assert terms.terms() == {"thing in itself"}
+
+def test_dictionary_terms_changed_terms():
+    old = DictionaryTerms(["Geist", "Sein"])
+    new = DictionaryTerms(["geist", "Dasein"])
+    assert old.changedTerms(new) == {"sein", "dasein"}
+
+# TokenIndex
+#---------------------------------------------------------------------------------------------------------
+def tokens(text):
+    return DictionaryTerms().tokens(text)
+
+def test_token_index_blocks_with_term():
+    index = TokenIndex()
+    index.update(1, tokens("the absolute Geist"))
+    index.update(2, tokens("Geist alone"))
+    index.update(3, tokens("nothing here"))
+    assert index.blocksWith("geist") == {1, 2}
+    assert index.blocksWith("Absolute Geist") == {1}
+    assert index.blocksWith("Dasein") == set()
+
+def test_token_index_update_drops_removed_words():
+    index = TokenIndex()
+    index.update(1, tokens("the absolute Geist"))
+    index.update(1, tokens("the absolute"))
+    assert index.blocksWith("Geist") == set()
+    assert index.blocksWith("absolute") == {1}
+
+def test_token_index_splits_compound_tokens():
+    index = TokenIndex()
+    index.update(1, [("Kant's", 0)])
+    assert index.blocksWith("Kant") == {1}
+
+def test_token_index_discard_and_retain():
+    index = TokenIndex()
+    for block_id in range(4):
+        index.update(block_id, tokens("Geist {nb}".format(nb=block_id)))
+    index.discard(0)
+    assert index.blocksWith("Geist") == {1, 2, 3}
+    index.retain({2})
+    assert index.blocksWith("Geist") == {2}
+    assert len(index) == 1
+    index.discard(2)
+    assert index.blocksWith("Geist") == set()
+    assert not index._blocks
+
+def test_token_index_after_term_removed_from_dictionary():
+    terms = DictionaryTerms(["Geist", "Sein"])
+    index = TokenIndex()
+    blocks = {1: "Geist and Sein", 2: "only Sein", 3: "only Geist"}
+    for block_id, text in blocks.items():
+        index.update(block_id, terms.tokens(text))
+    old = DictionaryTerms(terms.terms())
+    terms.remove("Geist")
+    terms.build()
+    changed = terms.changedTerms(old)
+    assert changed == {"geist"}
+    # Only the blocks that held the removed term need rehighlighting.
+    assert set().union(*(index.blocksWith(term) for term in changed)) == {1, 3}
+    assert [list(terms.findAll(blocks[block_id])) for block_id in (1, 3)] == [[(10, 4)], []]